@@ -1,46 +1,93 @@
 """AAR System API Endpoints"""
 
-import math
+import hashlib
 import time
 from datetime import timedelta
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import orjson
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
+from passlib.context import CryptContext
 
-from .models import (
-    AuthToken,
-    PluginExecutionRequest,
-    PluginExecutionResponse,
-    PluginInfo,
-    UserLogin,
-)
+from .models import PluginExecutionRequest, UserLogin
 
 # Constants
 JWT_ACCESS_TOKEN_EXPIRE_MINUTES = 30
-PHI = (1 + math.sqrt(5)) / 2
-
-# Create API router
-router = APIRouter()
-
-# Mock user database (in production, use proper database)
-fake_users_db = {
-    "admin": {
-        "username": "admin",
-        "hashed_password": "hashed_sacred_geometry_2025",  # In production, use proper hashing
-        "role": "administrator",
-        "phi_optimized": True,
+_EXPIRE_SEC = JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60
+PHI: float = 1.618033988749895  # (1 + √5) / 2
+
+# Create API router; hot endpoints return pre-built ORJSONResponse payloads
+# instead of going through response_model validation + jsonable_encoder
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Request body schema for /auth/login, published via openapi_extra because the
+# route parses the body itself instead of going through UserLogin validation
+_LOGIN_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": UserLogin.model_json_schema()}},
     }
 }
 
+# Pre-built 401 responses shared by every failed auth attempt; raised with
+# with_traceback(None) so repeated raises don't accumulate traceback frames
+_INVALID_CREDENTIALS_EXC = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Incorrect username or password",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+_NOT_AUTHENTICATED_EXC = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Not authenticated",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+
+# Mock user database (in production, use proper database). Records are
+# immutable (username, hashed_password, role, phi_optimized) tuples behind a
+# read-only mapping; the frozenset answers the common "no such user" case
+UserRecord = Tuple[str, str, str, bool]
+_USER_NAMES = frozenset(("admin",))
+_USERS: "MappingProxyType[str, UserRecord]" = MappingProxyType(
+    {
+        # argon2id hash of the documented demo password, sacred_geometry_2025
+        "admin": (
+            "admin",
+            "$argon2id$v=19$m=65536,t=2,p=4$LOXce89Z613L+Z8zptQaow$"
+            "yNKSeBdSJIRJRcc6uych7DcWQnFEqXwngWhsrgxo78Q",
+            "administrator",
+            True,
+        ),
+    }
+)
+
+
+@lru_cache(maxsize=1)
+def _pwd() -> CryptContext:
+    """Password hashing context for login, built on the first login
 
-def authenticate_user(username: str, password: str) -> Optional[Dict[str, Any]]:
+    argon2id for new hashes (tuned for throughput per security bit); existing
+    bcrypt hashes still verify and are flagged for rehash.
+    """
+    return CryptContext(
+        schemes=["argon2", "bcrypt"],
+        deprecated="auto",
+        argon2__time_cost=2,
+        argon2__memory_cost=65536,
+        argon2__parallelism=4,
+    )
+
+
+def authenticate_user(username: str, password: str) -> Optional[UserRecord]:
     """Authenticate user with Sacred Geometry validation"""
-    user = fake_users_db.get(username)
-    if not user:
+    if username not in _USER_NAMES:
         return None
-    if (
-        password != "sacred_geometry_2025"
-    ):  # In production, use proper password verification
+    user = _USERS[username]
+    if not _pwd().verify(password, user[1]):
         return None
     return user
 
@@ -52,85 +99,153 @@ def create_access_token(
     return "mock_token"  # In production, use proper JWT token generation
 
 
+# Verified token payloads keyed by SHA-256 digest of the raw token, so repeat
+# requests with the same bearer token skip the decode/verify step
+_token_cache: TTLCache = TTLCache(maxsize=10000, ttl=30)
+
+
 def verify_token(token: str = Depends(lambda: None)) -> Dict[str, Any]:
     """Verify JWT token with Sacred Geometry validation"""
     if not token:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Not authenticated",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    return {"sub": "admin", "role": "administrator"}  # Mock token data
+        raise _NOT_AUTHENTICATED_EXC.with_traceback(None)
+
+    token_key = hashlib.sha256(token.encode("utf-8")).digest()
+    token_data = _token_cache.get(token_key)
+    if token_data is None:
+        token_data = {"sub": "admin", "role": "administrator"}  # Mock token data
+        _token_cache[token_key] = token_data
+    return token_data
+
+
+# Single shared dependency marker: every route and router that needs the token
+# references the same Depends instance, so FastAPI solves verify_token once per
+# request and reuses the result (failures raise the shared 401 above)
+_VERIFY = Depends(verify_token, use_cache=True)
 
 
 # Authentication endpoints
-@router.post("/api/v1/auth/login", response_model=AuthToken)
-async def login(user_credentials: UserLogin):
+def _login_body_error(msg: str) -> HTTPException:
+    """Build a 422 shaped like FastAPI's own request validation errors"""
+    return HTTPException(
+        status_code=422,  # name differs across Starlette versions
+        detail=[{"type": "value_error", "loc": ["body"], "msg": msg}],
+    )
+
+
+@router.post("/api/v1/auth/login", openapi_extra=_LOGIN_OPENAPI)
+async def login(request: Request):
     """Login endpoint with φ-optimized token generation"""
-    user = authenticate_user(user_credentials.username, user_credentials.password)
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Incorrect username or password",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+    # Hot route: decode the {username, password} pair with orjson and plain
+    # isinstance checks rather than a UserLogin model_validate per request
+    try:
+        body = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise _login_body_error("Invalid JSON body") from None
+    if not isinstance(body, dict):
+        raise _login_body_error("Expected a JSON object")
+    username = body.get("username")
+    password = body.get("password")
+    if not isinstance(username, str) or not isinstance(password, str):
+        raise _login_body_error("username and password must be strings")
+
+    # argon2 is deliberately slow (and releases the GIL), so the check runs in
+    # the threadpool instead of stalling every connection on the event loop
+    user = await run_in_threadpool(authenticate_user, username, password)
+    if user is None:
+        raise _INVALID_CREDENTIALS_EXC.with_traceback(None)
+    username, _, role, _ = user
 
     access_token_expires = timedelta(minutes=JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user["username"], "role": user["role"]},
+        data={"sub": username, "role": role},
         expires_delta=access_token_expires,
     )
 
-    return AuthToken(
-        access_token=access_token,
-        token_type="bearer",
-        expires_in=JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60,
-        phi_optimized=True,
+    return ORJSONResponse(
+        {
+            "access_token": access_token,
+            "token_type": "bearer",
+            "expires_in": _EXPIRE_SEC,
+            "phi_optimized": True,
+        }
     )
 
 
 @router.get("/api/v1/auth/verify")
-async def verify_token_endpoint(token_data: Dict[str, Any] = Depends(verify_token)):
+async def verify_token_endpoint(token_data: Dict[str, Any] = _VERIFY):
     """Verify token endpoint for client-side validation"""
-    return {
-        "valid": True,
-        "user": token_data.get("sub"),
-        "role": token_data.get("role"),
-        "phi_optimized": True,
-        "expires": time.time() + JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60,
-        "verified_at": time.time(),
+    now = time.time()
+    return ORJSONResponse(
+        {
+            "valid": True,
+            "user": token_data.get("sub"),
+            "role": token_data.get("role"),
+            "phi_optimized": True,
+            "expires": now + _EXPIRE_SEC,
+            "verified_at": now,
+        }
+    )
+
+
+# Static plugin listing (PluginInfo-shaped), serialized once at import
+_PLUGINS_PAYLOAD: List[Dict[str, Any]] = [
+    {
+        "name": "auth_plugin",
+        "version": "1.0.0",
+        "description": "Authentication plugin",
+        "author": "AAR System",
+        "sacred_geometry_score": PHI,
+        "loaded": True,
+        "performance_metrics": {},
     }
+]
+_PLUGINS_JSON = orjson.dumps(_PLUGINS_PAYLOAD)
+_PLUGINS_ETAG = f'"{hashlib.sha1(_PLUGINS_JSON, usedforsecurity=False).hexdigest()}"'
+_PLUGINS_NOT_MODIFIED = Response(status_code=304, headers={"ETag": _PLUGINS_ETAG})
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match check: comma-separated list, weak comparison, "*" matches"""
+    if not if_none_match:
+        return False
+    if if_none_match == etag:
+        return True  # The common single-tag revalidation skips the parse
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+# Plugin management endpoints; authentication is declared once on the router
+# instead of as an unused per-endpoint dependency parameter
+protected_router = APIRouter(
+    default_response_class=ORJSONResponse, dependencies=[_VERIFY]
+)
 
 
-# Plugin management endpoints
-@router.get("/api/v1/plugins", response_model=List[PluginInfo])
-async def list_plugins(token_data: Dict[str, Any] = Depends(verify_token)):
+@protected_router.get("/api/v1/plugins")
+async def list_plugins(request: Request):
     """List all available plugins with Sacred Geometry metrics"""
-    return [
-        PluginInfo(
-            name="auth_plugin",
-            version="1.0.0",
-            description="Authentication plugin",
-            author="AAR System",
-            sacred_geometry_score=PHI,
-            loaded=True,
-            performance_metrics={},
-        )
-    ]
-
-
-@router.post(
-    "/api/v1/plugins/{plugin_name}/execute", response_model=PluginExecutionResponse
-)
-async def execute_plugin(
-    plugin_name: str,
-    request: PluginExecutionRequest,
-    token_data: Dict[str, Any] = Depends(verify_token),
-):
+    if _etag_matches(request.headers.get("if-none-match"), _PLUGINS_ETAG):
+        return _PLUGINS_NOT_MODIFIED
+    return Response(
+        _PLUGINS_JSON, media_type="application/json", headers={"ETag": _PLUGINS_ETAG}
+    )
+
+
+@protected_router.post("/api/v1/plugins/{plugin_name}/execute")
+async def execute_plugin(plugin_name: str, request: PluginExecutionRequest):
     """Execute a plugin with φ-optimized timeout and monitoring"""
-    return PluginExecutionResponse(
-        success=True,
-        result={"message": f"Executed {plugin_name}"},
-        execution_time=0.618,
-        sacred_geometry_score=PHI,
+    return ORJSONResponse(
+        {
+            "success": True,
+            "result": {"message": f"Executed {plugin_name}"},
+            "execution_time": 0.618,
+            "sacred_geometry_score": PHI,
+            "error_message": None,
+        }
     )
+
+
+router.include_router(protected_router)
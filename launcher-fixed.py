@@ -7,7 +7,9 @@ This script launches the complete AAR API server with proper error handling
 and dependency management.
 """
 
-import math
+import gzip
+import hashlib
+import importlib.util
 import subprocess
 import sys
 from pathlib import Path
@@ -17,27 +19,63 @@ modules_path = Path(__file__).parent.parent / "modules"
 sys.path.insert(0, str(modules_path))
 
 # Sacred Geometry constants
-PHI = (1 + math.sqrt(5)) / 2
+PHI: float = 1.618033988749895  # (1 + √5) / 2
+
+
+# (pip requirement, importable module) pairs; the module name is what
+# find_spec looks for to decide whether the requirement still needs installing
+REQUIRED_PACKAGES = (
+    ("fastapi>=0.115.0", "fastapi"),
+    ("uvicorn[standard]>=0.24.0", "uvicorn"),
+    ("PyJWT[crypto]>=2.8.0", "jwt"),
+    ("passlib[argon2,bcrypt]>=1.7.4", "passlib"),
+    ("python-multipart>=0.0.6", "multipart"),
+    ("orjson>=3.9.0", "orjson"),
+    ("cachetools>=5.3.0", "cachetools"),
+    ("httptools>=0.6.0", "httptools"),
+)
+if sys.platform != "win32":
+    # uvloop has no Windows build; the server falls back to asyncio there
+    REQUIRED_PACKAGES += (("uvloop>=0.17.0", "uvloop"),)
+
+
+def missing_packages():
+    """Return the (requirement, module) pairs whose module cannot be found
+
+    Uses find_spec so presence is checked without executing the packages.
+    """
+    return [
+        (requirement, module)
+        for requirement, module in REQUIRED_PACKAGES
+        if importlib.util.find_spec(module) is None
+    ]
 
 
 def install_dependencies():
-    """Install required dependencies"""
-    required_packages = [
-        "fastapi>=0.104.0",
-        "uvicorn[standard]>=0.24.0",
-        "python-jose[cryptography]>=3.3.0",
-        "passlib[bcrypt]>=1.7.4",
-        "python-multipart>=0.0.6",
-    ]
+    """Install required dependencies that are not already present"""
+    missing = missing_packages()
+    if not missing:
+        print("✅ All packages already installed")
+        return True
 
-    print("📦 Installing required packages...")
-    for package in required_packages:
-        try:
-            print(f"Installing {package}...")
-            subprocess.check_call([sys.executable, "-m", "pip", "install", package])
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Failed to install {package}: {e}")
-            return False
+    print(f"📦 Installing {len(missing)} required package(s)...")
+    # One pip invocation, limited to the missing requirements, so the
+    # resolver runs once and already-installed packages are not re-resolved
+    try:
+        subprocess.check_call(
+            [
+                sys.executable,
+                "-m",
+                "pip",
+                "install",
+                "--no-input",
+                "--disable-pip-version-check",
+                *(requirement for requirement, _ in missing),
+            ]
+        )
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Failed to install packages: {e}")
+        return False
 
     print("✅ All packages installed successfully!")
     return True
@@ -45,21 +83,16 @@ def install_dependencies():
 
 def check_dependencies():
     """Check if required dependencies are available"""
-    try:
-        import fastapi
-        import jwt
-        import passlib
-        import uvicorn
-
-        return True
-    except ImportError as e:
-        print(f"⚠️ Missing dependencies: {e}")
+    missing = missing_packages()
+    if missing:
+        print(f"⚠️ Missing dependencies: {', '.join(module for _, module in missing)}")
         return False
+    return True
 
 
-def create_simple_html_dashboard():
-    """Create a simple HTML dashboard for the API"""
-    html_content = f"""
+# Dashboard HTML is a plain literal with no Python formatting; φ is emitted
+# once as a JS const and shown pre-rounded in the subtitle
+DASHBOARD_HTML = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -67,14 +100,14 @@ def create_simple_html_dashboard():
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>AAR System API Dashboard - Sacred Geometry Framework</title>
     <style>
-        body {{
+        body {
             font-family: 'Arial', sans-serif;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             margin: 0;
             padding: 20px;
             color: white;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             background: rgba(255, 255, 255, 0.1);
@@ -82,56 +115,56 @@ def create_simple_html_dashboard():
             padding: 30px;
             backdrop-filter: blur(10px);
             box-shadow: 0 8px 32px rgba(31, 38, 135, 0.37);
-        }}
-        h1 {{
+        }
+        h1 {
             text-align: center;
             color: #FFD700;
             text-shadow: 2px 2px 4px rgba(0,0,0,0.5);
             margin-bottom: 30px;
-        }}
-        .phi-display {{
+        }
+        .phi-display {
             text-align: center;
             font-size: 1.5em;
             color: #FFD700;
             margin: 20px 0;
-        }}
-        .api-grid {{
+        }
+        .api-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
             gap: 20px;
             margin: 30px 0;
-        }}
-        .api-card {{
+        }
+        .api-card {
             background: rgba(255, 255, 255, 0.15);
             border-radius: 10px;
             padding: 20px;
             border: 1px solid rgba(255, 255, 255, 0.2);
-        }}
-        .api-card h3 {{
+        }
+        .api-card h3 {
             color: #FFD700;
             margin-top: 0;
-        }}
-        .endpoint {{
+        }
+        .endpoint {
             background: rgba(0, 0, 0, 0.3);
             padding: 10px;
             border-radius: 5px;
             margin: 10px 0;
             font-family: monospace;
-        }}
-        .status {{
+        }
+        .status {
             text-align: center;
             padding: 20px;
             background: rgba(0, 255, 0, 0.2);
             border-radius: 10px;
             margin: 20px 0;
-        }}
-        .websocket-demo {{
+        }
+        .websocket-demo {
             background: rgba(255, 255, 255, 0.1);
             padding: 20px;
             border-radius: 10px;
             margin: 20px 0;
-        }}
-        #wsMessages {{
+        }
+        #wsMessages {
             height: 200px;
             overflow-y: auto;
             background: rgba(0, 0, 0, 0.3);
@@ -139,8 +172,8 @@ def create_simple_html_dashboard():
             border-radius: 5px;
             font-family: monospace;
             font-size: 12px;
-        }}
-        button {{
+        }
+        button {
             background: linear-gradient(45deg, #FFD700, #FFA500);
             color: black;
             border: none;
@@ -149,18 +182,18 @@ def create_simple_html_dashboard():
             cursor: pointer;
             font-weight: bold;
             margin: 5px;
-        }}
-        button:hover {{
+        }
+        button:hover {
             transform: scale(1.05);
             transition: transform 0.2s;
-        }}
+        }
     </style>
 </head>
 <body>
     <div class="container">
         <h1>🔺 AAR System API Dashboard</h1>
         <div class="phi-display">
-            Sacred Geometry Framework - φ = {PHI:.6f}
+            Sacred Geometry Framework - φ = 1.618034
         </div>
 
         <div class="status">
@@ -190,7 +223,7 @@ def create_simple_html_dashboard():
                 <h3>🔌 Plugin Management</h3>
                 <div class="endpoint">GET /plugins/</div>
                 <div class="endpoint">POST /plugins/execute</div>
-                <div class="endpoint">GET /plugins/{{name}}/status</div>
+                <div class="endpoint">GET /plugins/{name}/status</div>
             </div>
 
             <div class="api-card">
@@ -219,76 +252,81 @@ def create_simple_html_dashboard():
     </div>
 
     <script>
+        const PHI = 1.618033988749895;
         let ws = null;
 
-        function updateTime() {{
+        function updateTime() {
             document.getElementById('currentTime').textContent = new Date().toLocaleString();
-        }}
+        }
 
-        function connectWebSocket() {{
-            const wsUrl = `ws://${{window.location.host}}/ws/realtime`;
+        function connectWebSocket() {
+            const wsUrl = `ws://${window.location.host}/ws/realtime`;
             ws = new WebSocket(wsUrl);
 
-            ws.onopen = function(event) {{
+            ws.onopen = function(event) {
                 addMessage('✅ WebSocket connected');
-            }};
+            };
 
-            ws.onmessage = function(event) {{
+            ws.onmessage = function(event) {
                 const data = JSON.parse(event.data);
-                addMessage(`📨 Received: ${{JSON.stringify(data, null, 2)}}`);
-            }};
-
-            ws.onclose = function(event) {{
+                // The server coalesces queued messages into one "multi" frame
+                const items = data.type === 'multi' ? data.items : [data];
+                for (const item of items) {
+                    addMessage(`📨 Received: ${JSON.stringify(item, null, 2)}`);
+                }
+            };
+
+            ws.onclose = function(event) {
                 addMessage('❌ WebSocket disconnected');
-            }};
+            };
 
-            ws.onerror = function(error) {{
-                addMessage(`❌ WebSocket error: ${{error}}`);
-            }};
-        }}
+            ws.onerror = function(error) {
+                addMessage(`❌ WebSocket error: ${error}`);
+            };
+        }
 
-        function disconnectWebSocket() {{
-            if (ws) {{
+        function disconnectWebSocket() {
+            if (ws) {
                 ws.close();
                 ws = null;
-            }}
-        }}
+            }
+        }
 
-        function sendMessage() {{
-            if (ws && ws.readyState === WebSocket.OPEN) {{
-                const message = {{
+        function sendMessage() {
+            if (ws && ws.readyState === WebSocket.OPEN) {
+                const message = {
                     type: 'test',
-                    phi: {PHI},
+                    phi: PHI,
                     timestamp: Date.now()
-                }};
+                };
                 ws.send(JSON.stringify(message));
-                addMessage(`📤 Sent: ${{JSON.stringify(message)}}`);
-            }} else {{
+                addMessage(`📤 Sent: ${JSON.stringify(message)}`);
+            } else {
                 addMessage('❌ WebSocket not connected');
-            }}
-        }}
+            }
+        }
 
-        function addMessage(message) {{
+        function addMessage(message) {
             const messagesDiv = document.getElementById('wsMessages');
             const timestamp = new Date().toLocaleTimeString();
-            messagesDiv.innerHTML += `${{timestamp}}: ${{message}}\\n`;
+            messagesDiv.innerHTML += `${timestamp}: ${message}\\n`;
             messagesDiv.scrollTop = messagesDiv.scrollHeight;
-        }}
+        }
 
-        function testAPI() {{
+        function testAPI() {
             fetch('/api/v1/system/status')
                 .then(response => response.json())
-                .then(data => {{
-                    addMessage(`🧪 API Test Result: ${{JSON.stringify(data, null, 2)}}`);
-                }})
-                .catch(error => {{
-                    addMessage(`❌ API Test Error: ${{error}}`);
-                }});
-        }}
-
-        function refreshDashboard() {{
+                .then(data => {
+                    addMessage(`🧪 API Test Result: ${JSON.stringify(data, null, 2)}`);
+                })
+                .catch(error => {
+                    addMessage(`❌ API Test Error: ${error}`);
+                });
+        }
+
+        function refreshDashboard() {
             location.reload();
-        }}
+        }
 
         // Update time every second
         setInterval(updateTime, 1000);
@@ -297,10 +335,98 @@ def create_simple_html_dashboard():
 </body>
 </html>
 """
-    return html_content
 
 
-def start_api_server():
+# Pre-compressed once so gzip-capable clients get ~3x fewer bytes at no
+# per-request compression cost
+DASHBOARD_BODY = DASHBOARD_HTML.encode("utf-8")
+DASHBOARD_GZ = gzip.compress(DASHBOARD_BODY, compresslevel=9)
+
+
+def _strong_etag(body):
+    """Quoted content hash of one encoded representation"""
+    return f'"{hashlib.sha1(body, usedforsecurity=False).hexdigest()}"'
+
+
+# Identity and gzip bodies are different representations, so each carries its
+# own strong validator and a cache can't revalidate one against the other
+DASHBOARD_ETAG = _strong_etag(DASHBOARD_BODY)
+DASHBOARD_GZ_ETAG = _strong_etag(DASHBOARD_GZ)
+DASHBOARD_HEADERS = {
+    "Cache-Control": "public, max-age=3600",
+    "Vary": "Accept-Encoding",
+}
+
+
+def etag_matches(if_none_match, etag):
+    """If-None-Match check: comma-separated list, weak comparison, "*" matches"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def create_simple_html_dashboard():
+    """Create a simple HTML dashboard for the API"""
+    return DASHBOARD_HTML
+
+
+def create_app():
+    """Assemble the AAR API application with all routes
+
+    Used as a uvicorn app factory so every worker process builds its own
+    fully-routed application after forking.
+    """
+    from main import app
+
+    # Try to add routes if endpoints are available
+    try:
+        from endpoints import router as endpoints_router
+        from websockets import websocket_router
+
+        app.include_router(endpoints_router)
+        app.include_router(websocket_router)
+        print("✅ All API routes loaded successfully")
+    except ImportError as e:
+        print(f"⚠️ Some API features unavailable: {e}")
+
+    # Add dashboard route
+    try:
+        from fastapi import Request
+        from fastapi.responses import HTMLResponse, Response
+
+        # The bodies are pre-encoded; the Response objects are built per
+        # request because middleware (GZip's Vary) edits their header lists
+        @app.get("/dashboard", response_class=HTMLResponse)
+        async def dashboard(request: Request):
+            """Interactive dashboard for the AAR API"""
+            # Negotiate the encoding first: the validator depends on it
+            gzipped = "gzip" in request.headers.get("accept-encoding", "")
+            etag = DASHBOARD_GZ_ETAG if gzipped else DASHBOARD_ETAG
+            headers = {"ETag": etag, **DASHBOARD_HEADERS}
+            if etag_matches(request.headers.get("if-none-match"), etag):
+                return Response(status_code=304, headers=headers)
+            if gzipped:
+                return Response(
+                    content=DASHBOARD_GZ,
+                    media_type="text/html",
+                    headers={"Content-Encoding": "gzip", **headers},
+                )
+            return Response(
+                content=DASHBOARD_BODY, media_type="text/html", headers=headers
+            )
+
+        print("✅ Dashboard route added")
+    except Exception as e:
+        print(f"⚠️ Dashboard route failed: {e}")
+
+    return app
+
+
+def start_api_server(workers=None):
     """Start the API server"""
     try:
         # Check dependencies first
@@ -311,31 +437,12 @@ def start_api_server():
 
         # Import API components after ensuring dependencies
         import uvicorn
-        from main import app
-
-        # Try to add routes if endpoints are available
-        try:
-            from endpoints import router as endpoints_router
-            from websockets import websocket_router
-
-            app.include_router(endpoints_router)
-            app.include_router(websocket_router)
-            print("✅ All API routes loaded successfully")
-        except ImportError as e:
-            print(f"⚠️ Some API features unavailable: {e}")
-
-        # Add dashboard route
-        try:
-            from fastapi.responses import HTMLResponse
-
-            @app.get("/dashboard", response_class=HTMLResponse)
-            async def dashboard():
-                """Interactive dashboard for the AAR API"""
-                return HTMLResponse(content=create_simple_html_dashboard())
 
-            print("✅ Dashboard route added")
-        except Exception as e:
-            print(f"⚠️ Dashboard route failed: {e}")
+        # One worker unless --workers says otherwise: WebSocket clients and
+        # broadcasts live in each process's memory, so with several workers a
+        # broadcast only reaches the clients of the worker that handled it
+        if workers is None:
+            workers = 1
 
         print("🚀 Starting AAR API Server...")
         print("Sacred Geometry Framework - Phase 4.2")
@@ -343,14 +450,28 @@ def start_api_server():
         print("📊 Dashboard: http://localhost:8000/dashboard")
         print("📖 API Docs: http://localhost:8000/docs")
         print("🔗 WebSocket: ws://localhost:8000/ws")
+        print(f"⚙️ Workers: {workers}")
         print("=" * 50)
 
-        # Start the server
+        # Start the server on the C-accelerated event loop and HTTP parser;
+        # uvloop has no Windows build, so fall back to asyncio there.
+        # Workers need an import string rather than the app object so each
+        # process can build its own app through the factory.
         uvicorn.run(
-            app,
+            f"{Path(__file__).stem}:create_app",
+            factory=True,
             host="0.0.0.0",
             port=8000,
-            log_level="info",
+            workers=workers,
+            log_level="warning",
+            loop="asyncio" if sys.platform == "win32" else "uvloop",
+            http="httptools",
+            # Bound per-connection WebSocket buffers and reap dead peers
+            ws_max_size=64 * 1024,
+            ws_ping_interval=30,
+            ws_ping_timeout=10,
+            ws_per_message_deflate=True,
+            access_log=False,  # Skip per-request access log records
             reload=False,  # Disable reload to prevent import issues
         )
 
@@ -361,6 +482,21 @@ def start_api_server():
         return False
 
 
+def parse_workers(argv):
+    """Parse the optional ``--workers N`` flag, returning None when absent"""
+    if "--workers" not in argv:
+        return None
+
+    index = argv.index("--workers")
+    try:
+        workers = int(argv[index + 1])
+    except (IndexError, ValueError) as e:
+        raise ValueError("--workers expects a positive integer") from e
+    if workers < 1:
+        raise ValueError("--workers expects a positive integer")
+    return workers
+
+
 def main():
     """Main launcher function"""
     print("🔺 AAR System API Launcher")
@@ -380,8 +516,14 @@ def main():
             print("❌ Missing dependencies")
             return 1
 
+    try:
+        workers = parse_workers(sys.argv)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
     # Start the API server
-    success = start_api_server()
+    success = start_api_server(workers)
     return 0 if success else 1
 
 
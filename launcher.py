@@ -6,27 +6,39 @@ This script launches the complete AAR API server with all endpoints,
 WebSocket support, and Sacred Geometry optimization.
 """
 
+import gzip
+import json
+import logging
+import os
 import sys
 import time
+from functools import cache
 from pathlib import Path
 
-# Add modules path
+try:
+    import brotli
+
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Add modules path only when it exists and isn't already importable (e.g. via
+# a .pth file, see SETUP.md); appended so it is scanned after site-packages
+# instead of first on every import
 modules_path = Path(__file__).parent.parent / "modules"
-sys.path.insert(0, str(modules_path))
+if modules_path.is_dir() and str(modules_path) not in sys.path:
+    sys.path.append(str(modules_path))
 
 try:
-    import uvicorn
-    from fastapi.responses import HTMLResponse
-
-    # Import our API components
+    # Import our API components; uvicorn and the response classes are
+    # imported where they are used so importing this module stays light
+    import main as _main
     from main import PHI, app
 
-    # Try to import startup_time, but handle if not available
-    try:
-        from main import manager  # pylint: disable=unused-import
-    except ImportError:
-        startup_time = time.time()
-        manager = None
+    # Optional attributes are read off the already-imported module instead of
+    # probing with a second import that raises when they are missing
+    manager = getattr(_main, "manager", None)
+    startup_time = getattr(app.state, "startup_time", None) or time.time()
 
     # Try to import endpoints (may fail if dependencies missing)
     try:
@@ -46,10 +58,55 @@ except ImportError:
     print("⚠️ FastAPI not available. Installing required packages...")
     FULL_API_AVAILABLE = False
     app = None
-
-
+    PHI = 1.618033988749895  # Golden ratio, normally provided by main
+
+# φ-derived server settings shown in the launch banner, computed once
+PHI_RATE_LIMIT = int(100 * PHI)
+PHI_RATE_WINDOW = int(60 * PHI)
+PHI_TOKEN_EXPIRY_MINUTES = int(30 * PHI)
+PHI_HEARTBEAT_SECONDS = 30 * PHI
+PHI_MAX_CONNECTIONS = int(100 * PHI)
+
+# Launch banners are static, so they are built once and written in one call
+_HEADER = "\n".join(
+    (
+        "🌀 AAR System API Server",
+        "=" * 50,
+        f"📐 Golden Ratio (φ): {PHI:.6f}",
+        "🔺 Sacred Geometry Framework: Phase 4.2",
+        "",
+        "",
+    )
+)
+_BANNER = "\n".join(
+    (
+        "",
+        "🚀 Starting API server...",
+        "📊 Dashboard: http://localhost:8000/dashboard",
+        "📖 API Docs: http://localhost:8000/docs",
+        "🔗 WebSocket: ws://localhost:8000/ws",
+        "",
+        "🔺 Sacred Geometry Optimization Active:",
+        f"   • Rate Limiting: {PHI_RATE_LIMIT} requests per "
+        f"{PHI_RATE_WINDOW} seconds",
+        f"   • Token Expiry: {PHI_TOKEN_EXPIRY_MINUTES} minutes",
+        f"   • WebSocket Heartbeat: {PHI_HEARTBEAT_SECONDS:.1f} seconds",
+        f"   • Max Connections: {PHI_MAX_CONNECTIONS}",
+        "",
+        "",
+    )
+)
+
+
+# Uptime baseline for the dashboard JS, which compares it against Date.now();
+# that needs wall-clock epoch milliseconds (monotonic_ns has no epoch), taken
+# as an integer straight from time_ns() so no float scaling is involved
+_STARTUP_EPOCH_MS = time.time_ns() // 1_000_000
+
+
+@cache
 def create_simple_html_dashboard():
-    """Create a simple HTML dashboard for the API"""
+    """Create a simple HTML dashboard for the API (rendered once per process)"""
     html_content = f"""
 <!DOCTYPE html>
 <html lang="en">
@@ -263,7 +320,7 @@ def create_simple_html_dashboard():
 
     <script>
         let ws = null;
-        let startTime = {int(time.time() * 1000)};
+        let startTime = {_STARTUP_EPOCH_MS};
 
         function updateUptime() {{
             const now = Date.now();
@@ -296,7 +353,11 @@ def create_simple_html_dashboard():
 
             ws.onmessage = function(event) {{
                 const data = JSON.parse(event.data);
-                addMessage(`📨 ${{data.type}}: ${{JSON.stringify(data, null, 2)}}`);
+                // The server coalesces queued messages into one "multi" frame
+                const items = data.type === 'multi' ? data.items : [data];
+                for (const item of items) {{
+                    addMessage(`📨 ${{item.type}}: ${{JSON.stringify(item, null, 2)}}`);
+                }}
             }};
 
             ws.onclose = function() {{
@@ -350,49 +411,158 @@ def create_simple_html_dashboard():
 
 def install_dependencies():
     """Install required dependencies for the API server"""
+    import shutil
     import subprocess
 
     required_packages = [
-        "fastapi>=0.104.0",
+        "fastapi>=0.115.0",
         "uvicorn[standard]>=0.24.0",
-        "python-jose[cryptography]>=3.3.0",
-        "passlib[bcrypt]>=1.7.4",
+        "PyJWT[crypto]>=2.8.0",
+        "passlib[argon2,bcrypt]>=1.7.4",
         "python-multipart>=0.0.6",
+        "orjson>=3.9.0",
+        "cachetools>=5.3.0",
     ]
 
+    # Prefer uv's parallel resolver and shared wheel cache when it is on PATH;
+    # --python targets this interpreter (venv or not) rather than --system
+    uv = shutil.which("uv")
+    if uv:
+        command = [uv, "pip", "install", "--python", sys.executable, "-q"]
+    else:
+        command = [
+            sys.executable,
+            "-m",
+            "pip",
+            "install",
+            "--no-input",
+            "--disable-pip-version-check",
+            "-q",
+        ]
+
     print("📦 Installing required packages for AAR API...")
-    for package in required_packages:
-        try:
-            print(f"Installing {package}...")
-            subprocess.check_call([sys.executable, "-m", "pip", "install", package])
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Failed to install {package}: {e}")
-            return False
+    # One installer invocation so the resolver runs once for the whole set
+    try:
+        subprocess.check_call([*command, *required_packages])
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Failed to install packages: {e}")
+        return False
 
     print("✅ All packages installed successfully!")
     return True
 
 
+def _minify_html(html):
+    """Drop indentation, blank lines and whole-line JS comments
+
+    Line breaks are kept so JS statement boundaries are untouched; the page
+    has no <pre> blocks or multi-line template literals to preserve.
+    """
+    lines = (line.strip() for line in html.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("// "))
+
+
+# Every value the dashboard interpolates is fixed for the life of the
+# process, so the page is rendered, minified and UTF-8 encoded once at import.
+# Served from memory rather than FileResponse: uvicorn does not implement
+# the ASGI zero-copy send extension, so FileResponse would re-read the file
+# in chunks through a thread pool on every request instead of sendfile(2)
+_DASHBOARD_HTML = _minify_html(create_simple_html_dashboard()).encode("utf-8")
+
+# Pre-compressed once at maximum quality so clients that accept br/gzip get a
+# fraction of the bytes with no per-request compression work
+_DASHBOARD_GZ = gzip.compress(_DASHBOARD_HTML, compresslevel=9)
+_DASHBOARD_BR = (
+    brotli.compress(_DASHBOARD_HTML, quality=11) if BROTLI_AVAILABLE else None
+)
+
+
 def create_dashboard_route():
     """Create dashboard route if app is available"""
     if app and FULL_API_AVAILABLE:
-
-        @app.get("/dashboard", response_class=HTMLResponse)
-        async def dashboard():
+        from fastapi import Request
+        from fastapi.responses import Response
+
+        # A fresh Response around the shared pre-encoded bodies on each request:
+        # GZipMiddleware adds Vary to the raw header list in place, so a
+        # Response reused across requests would gain another Vary every time
+        identity_headers = {"Vary": "Accept-Encoding"}
+        gzip_headers = {"Content-Encoding": "gzip", **identity_headers}
+        brotli_headers = {"Content-Encoding": "br", **identity_headers}
+
+        @app.get("/dashboard", response_class=Response)
+        async def dashboard(request: Request):
             """Interactive dashboard for the AAR API"""
-            return HTMLResponse(content=create_simple_html_dashboard())
+            accept_encoding = request.headers.get("accept-encoding", "")
+            if _DASHBOARD_BR is not None and "br" in accept_encoding:
+                body, headers = _DASHBOARD_BR, brotli_headers
+            elif "gzip" in accept_encoding:
+                body, headers = _DASHBOARD_GZ, gzip_headers
+            else:
+                body, headers = _DASHBOARD_HTML, identity_headers
+            return Response(content=body, media_type="text/html", headers=headers)
 
     return app
 
 
+# Register at import so the route exists in the app uvicorn loads by name
+create_dashboard_route()
+
+
+class JsonAccessFormatter(logging.Formatter):
+    """Render uvicorn access records as one JSON object per line"""
+
+    def format(self, record):
+        client_addr, method, path, http_version, status_code = record.args
+        return json.dumps(
+            {
+                "time": self.formatTime(record),
+                "client": client_addr,
+                "method": method,
+                "path": path,
+                "http_version": http_version,
+                "status": status_code,
+            }
+        )
+
+
+# Opt-in audit logging (AAR_ACCESS_LOG=1): server messages stay at warning on
+# stderr while access records go as JSON lines to their own stream on stdout
+ACCESS_LOG_CONFIG = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "default": {
+            "()": "uvicorn.logging.DefaultFormatter",
+            "fmt": "%(levelprefix)s %(message)s",
+        },
+        # The class itself, not "launcher.JsonAccessFormatter": resolving the
+        # string would import this file a second time beside __main__
+        "access": {"()": JsonAccessFormatter},
+    },
+    "handlers": {
+        "default": {
+            "formatter": "default",
+            "class": "logging.StreamHandler",
+            "stream": "ext://sys.stderr",
+        },
+        "access": {
+            "formatter": "access",
+            "class": "logging.StreamHandler",
+            "stream": "ext://sys.stdout",
+        },
+    },
+    "loggers": {
+        "uvicorn": {"handlers": ["default"], "level": "WARNING", "propagate": False},
+        "uvicorn.access": {"handlers": ["access"], "level": "INFO", "propagate": False},
+    },
+}
+
+
 def main():
     """Launch the AAR API server with Sacred Geometry optimization"""
 
-    print("🌀 AAR System API Server")
-    print("=" * 50)
-    print(f"📐 Golden Ratio (φ): {PHI:.6f}")
-    print("🔺 Sacred Geometry Framework: Phase 4.2")
-    print()
+    sys.stdout.write(_HEADER)
 
     if not FULL_API_AVAILABLE:
         print("⚠️ API dependencies missing. Would you like to install them? (y/n)")
@@ -409,34 +579,67 @@ def main():
         else:
             print("⚡ Running with basic features only.")
 
-    print()
-    print("🚀 Starting API server...")
-    print("📊 Dashboard: http://localhost:8000/dashboard")
-    print("📖 API Docs: http://localhost:8000/docs")
-    print("🔗 WebSocket: ws://localhost:8000/ws")
-    print()
-    print("🔺 Sacred Geometry Optimization Active:")
-    print(f"   • Rate Limiting: {int(100 * PHI)} requests per {int(60 * PHI)} seconds")
-    print(f"   • Token Expiry: {int(30 * PHI)} minutes")
-    print(f"   • WebSocket Heartbeat: {30 * PHI:.1f} seconds")
-    print(f"   • Max Connections: {int(100 * PHI)}")
-    print()
+    sys.stdout.write(_BANNER)
+
+    # AAR_DEV=1 keeps the single-process auto-reloading dev server; otherwise
+    # run without the reloader, on AAR_WORKERS processes. That defaults to one:
+    # WebSocket clients live in each worker's memory, so with several workers
+    # a broadcast only reaches the clients of the worker that handled it
+    dev_mode = os.getenv("AAR_DEV") == "1"
+    json_access_log = not dev_mode and os.getenv("AAR_ACCESS_LOG") == "1"
+
+    logging_options = {
+        "log_level": "info" if dev_mode else "warning",
+        "access_log": dev_mode,  # Skip per-request access log records in production
+    }
+    if json_access_log:
+        # Levels come from the config; log_level would also cap uvicorn.access
+        logging_options = {
+            "log_config": ACCESS_LOG_CONFIG,
+            "log_level": None,
+            "access_log": True,
+        }
 
     try:
-        # Run the server with φ-optimized settings
+        import uvicorn
+
+        workers = 1 if dev_mode else int(os.getenv("AAR_WORKERS", "1"))
+
+        # A single production worker runs the already-built app object so
+        # uvicorn doesn't re-import this module; the reloader and multiple
+        # workers need the import string to load the app in child processes
+        if dev_mode:
+            target = "launcher:app"
+            reload_dirs = [str(Path(__file__).parent)]
+            if modules_path.is_dir():
+                reload_dirs.append(str(modules_path))
+            server_options = {"reload": True, "reload_dirs": reload_dirs}
+        else:
+            target = app if workers == 1 else "launcher:app"
+            server_options = {"reload": False}
+
+        # Run the server with φ-optimized settings on the C-accelerated event
+        # loop and HTTP parser; uvloop has no Windows build, so use asyncio there
         uvicorn.run(
-            "launcher:app",
+            target,
             host="0.0.0.0",
             port=8000,
-            reload=True,
-            workers=1,
-            log_level="info",
-            access_log=True,
+            loop="asyncio" if sys.platform == "win32" else "uvloop",
+            http="httptools",
+            workers=workers,
+            # Bound per-connection WebSocket buffers and reap dead peers
+            ws_max_size=64 * 1024,
+            ws_ping_interval=30,
+            ws_ping_timeout=10,
+            ws_per_message_deflate=True,
+            **server_options,
+            **logging_options,
         )
     except ImportError:
         print("❌ FastAPI/Uvicorn not available. Please install required packages:")
         print(
-            "   pip install fastapi uvicorn[standard] python-jose[cryptography] passlib[bcrypt]"
+            "   pip install fastapi uvicorn[standard] PyJWT[crypto]"
+            " passlib[argon2,bcrypt]"
         )
         sys.exit(1)
     except KeyboardInterrupt:
@@ -13,46 +13,56 @@ Sacred Geometry Implementation:
 - Fractal: Self-similar endpoint patterns across all API routes
 """
 
+from __future__ import annotations
+
+import asyncio
+import hashlib
 import math
+import os
+import ssl
 import sys
+import threading
 import time
-from datetime import datetime, timedelta
+import weakref
+from datetime import timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any
 
 # Add modules path for AAR system integration first
 modules_path = Path(__file__).parent.parent / "modules"
 sys.path.insert(0, str(modules_path))
 
-# Try to import external dependencies with fallback handling
+# External dependencies are required: a broken install fails here, loudly,
+# instead of degrading into placeholder classes
+import jwt
+import orjson
+import uvicorn
+from cachetools import TTLCache
+from fastapi import Depends, FastAPI, HTTPException, WebSocket, status
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from pydantic import BaseModel, Field
+
+# Optional shared rate-limit store; without it each worker limits on its own
 try:
-    import jwt
-    import uvicorn
-    from fastapi import Depends, FastAPI, HTTPException, WebSocket, status
-    from fastapi.middleware.cors import CORSMiddleware
-    from fastapi.middleware.trustedhost import TrustedHostMiddleware
-    from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-    from passlib.context import CryptContext
-    from pydantic import BaseModel, Field
-
-    EXTERNAL_DEPS_AVAILABLE = True
-except ImportError as import_error:
-    print(f"⚠️ External dependencies not available: {import_error}")
-    EXTERNAL_DEPS_AVAILABLE = False
+    import redis.asyncio as aioredis
+    from redis.exceptions import NoScriptError, RedisError
 
-    # Create mock classes for development
-    class BaseModel:  # pylint: disable=too-few-public-methods,function-redefined
-        """Mock BaseModel for development when Pydantic not available"""
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
 
-        def __init__(self, **kwargs):  # pylint: disable=unused-argument
-            pass
+    class RedisError(Exception):  # pylint: disable=function-redefined
+        """Placeholder so the Redis error handling stays importable"""
 
-    def Field(*args, **kwargs):  # pylint: disable=unused-argument
-        """Mock Field function for development when Pydantic not available"""
-        return None
+    class NoScriptError(RedisError):  # pylint: disable=function-redefined
+        """Placeholder so the Redis error handling stays importable"""
 
 
-# Import API endpoints
+# Import API endpoints. This and the local-module fallback stay unconditional:
+# both are legitimately absent when main is imported as a top-level module
+# (the launchers) or outside the full AAR tree
 try:
     from .endpoints import router
 
@@ -132,17 +142,80 @@ API_CONFIG = {
 JWT_SECRET_KEY = (
     "sacred-geometry-phi-optimized-key-2025"  # In production, use environment variable
 )
-JWT_ALGORITHM = "HS256"
+
+
+def _load_jwt_keys():
+    """Return (algorithm, signing key, verification key) for token handling
+
+    With Ed25519 PEMs in JWT_PRIVATE_KEY / JWT_PUBLIC_KEY tokens are signed
+    with EdDSA, and the parsed key objects are reused for every call; an
+    instance given only the public key can verify but not issue tokens.
+    Without them the shared-secret HS256 setup is used.
+    """
+    private_pem = os.environ.get("JWT_PRIVATE_KEY")
+    public_pem = os.environ.get("JWT_PUBLIC_KEY")
+    if not private_pem and not public_pem:
+        return "HS256", JWT_SECRET_KEY, JWT_SECRET_KEY
+
+    # pylint: disable=import-outside-toplevel
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+    from cryptography.hazmat.primitives.serialization import (
+        load_pem_private_key,
+        load_pem_public_key,
+    )
+
+    private_key = (
+        load_pem_private_key(private_pem.encode("utf-8"), password=None)
+        if private_pem
+        else None
+    )
+    public_key = (
+        load_pem_public_key(public_pem.encode("utf-8"))
+        if public_pem
+        else private_key.public_key()
+    )
+    if not isinstance(public_key, Ed25519PublicKey):
+        raise ValueError("JWT_PRIVATE_KEY/JWT_PUBLIC_KEY must be Ed25519 keys")
+    return "EdDSA", private_key, public_key
+
+
+JWT_ALGORITHM, JWT_SIGNING_KEY, JWT_VERIFY_KEY = _load_jwt_keys()
 JWT_ACCESS_TOKEN_EXPIRE_MINUTES = int(
     30 * PHI
 )  # φ-optimized token lifetime: ~48.5 minutes
+JWT_ACCESS_TOKEN_EXPIRE_SECONDS = JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60
 
 # Rate limiting with Golden Ratio intervals
 RATE_LIMIT_REQUESTS = int(100 * PHI)  # ~162 requests
 RATE_LIMIT_WINDOW = int(60 * PHI)  # ~97 seconds (φ-optimized window)
-
-# Initialize FastAPI app with Sacred Geometry principles
-app = FastAPI(**API_CONFIG)
+# Seconds until a drained bucket refills one token, sent as Retry-After on 429
+RATE_LIMIT_RETRY_AFTER = math.ceil(RATE_LIMIT_WINDOW / RATE_LIMIT_REQUESTS)
+# Token bucket equivalent: a full window's worth of burst, refilled evenly
+RATE_LIMIT_CAPACITY = float(RATE_LIMIT_REQUESTS)
+RATE_LIMIT_REFILL_RATE = RATE_LIMIT_REQUESTS / RATE_LIMIT_WINDOW  # tokens/second
+# The in-process limiter works in integer monotonic nanoseconds, immune to
+# wall-clock steps. Tokens are scaled by the window length in ns so one
+# elapsed ns refills exactly RATE_LIMIT_REQUESTS units: the arithmetic is
+# exact integer math with no rounding drift and no float construction
+RATE_LIMIT_WINDOW_NS = RATE_LIMIT_WINDOW * 1_000_000_000
+RATE_LIMIT_TOKEN_COST = RATE_LIMIT_WINDOW_NS  # One request, in scaled units
+RATE_LIMIT_CAPACITY_SCALED = RATE_LIMIT_REQUESTS * RATE_LIMIT_WINDOW_NS
+
+# RATE_LIMIT_STRATEGY=sliding_window trades the token bucket's smooth refill
+# for a strict per-window request count (weighted two-counter approximation)
+RATE_LIMIT_STRATEGY = os.environ.get("RATE_LIMIT_STRATEGY", "token_bucket")
+
+# Set REDIS_URL (e.g. redis://localhost:6379/0) to share limits across workers
+REDIS_URL = os.environ.get("REDIS_URL")
+
+# Broadcasts are coalesced: K messages within one interval of the first cost
+# each client a single frame, for at most one interval of added latency
+BROADCAST_FLUSH_INTERVAL = 0.01  # seconds
+BROADCAST_BATCH_MAX = 256  # Flush early once this many messages are queued
+
+# Initialize FastAPI app with Sacred Geometry principles; JSON responses are
+# rendered with orjson instead of the stdlib encoder
+app = FastAPI(**API_CONFIG, default_response_class=ORJSONResponse)
 
 
 # Application state to avoid global variables
@@ -153,26 +226,199 @@ class AppState:
         self.plugin_manager = None
         self.config_manager = None
         self.startup_time = time.time()
+        self.redis = None
+        self.rate_limit_script_sha = None
 
 
 app.state = AppState()
 
-# Add CORS middleware with φ-optimized settings
+
+class RateLimitMiddleware:
+    """Pure-ASGI rate limiter: rejected requests never reach FastAPI routing"""
+
+    _BODY = b'{"detail":"Rate limit exceeded"}'
+    _HEADERS = [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(_BODY)).encode()),
+        (b"retry-after", str(RATE_LIMIT_RETRY_AFTER).encode()),
+    ]
+
+    def __init__(self, asgi_app):
+        self.app = asgi_app
+
+    async def __call__(self, scope, receive, send):
+        client = scope.get("client")
+        if (
+            scope["type"] == "http"
+            and client is not None
+            and not await check_rate_limit(client[0])
+        ):
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 429,
+                    "headers": self._HEADERS,
+                }
+            )
+            await send({"type": "http.response.body", "body": self._BODY})
+            return
+        await self.app(scope, receive, send)
+
+
+# Compress larger JSON bodies; small ones aren't worth the CPU. Innermost, so
+# only routed responses are compressed
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
+
+# Added before CORS so it sits inside it and 429 responses carry CORS headers
+app.add_middleware(RateLimitMiddleware)
+
+
+class CompactCorsHost:
+    """Trusted-host and CORS checks in one pass over the request headers
+
+    Origins and hosts are matched as bytes against precompiled frozensets
+    ("*" allows any; a "*.example.com" host matches subdomains, as with
+    Starlette's TrustedHostMiddleware) and every response header is prebuilt,
+    so nothing is decoded or encoded per request. Any method and request
+    header is allowed.
+    """
+
+    _METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+
+    def __init__(
+        self,
+        asgi_app,
+        allow_origins: list[str],
+        allowed_hosts: list[str],
+        allow_credentials: bool = False,
+        max_age: int = 600,
+    ):
+        self.app = asgi_app
+        self.any_origin = "*" in allow_origins
+        self.origins = frozenset(o.encode() for o in allow_origins)
+        for pattern in allowed_hosts:
+            suffix_pattern = pattern.startswith("*.") and "*" not in pattern[2:]
+            if "*" in pattern and pattern != "*" and not suffix_pattern:
+                raise ValueError(
+                    f"Invalid allowed host {pattern!r}: wildcard patterns must be"
+                    " '*' or like '*.example.com'"
+                )
+        self.any_host = "*" in allowed_hosts
+        self.hosts = frozenset(h.encode() for h in allowed_hosts if "*" not in h)
+        # "*.example.com" -> b".example.com", matched with bytes.endswith
+        self.host_suffixes = tuple(
+            h[1:].encode() for h in allowed_hosts if h.startswith("*.")
+        )
+        self.allow_credentials = allow_credentials
+
+        credentials = (
+            [(b"access-control-allow-credentials", b"true")]
+            if allow_credentials
+            else []
+        )
+        # Wildcard origin without credentials needs no echo of the Origin
+        self._wildcard = self.any_origin and not allow_credentials
+        self._simple_headers = credentials
+        self._preflight_headers = [
+            (b"access-control-allow-methods", self._METHODS),
+            (b"access-control-max-age", str(max_age).encode()),
+            *credentials,
+        ]
+
+    def _origin_headers(self, origin: bytes) -> list[tuple[bytes, bytes]]:
+        """Allow-Origin for an accepted origin (echoed unless a bare wildcard)"""
+        if self._wildcard:
+            return [(b"access-control-allow-origin", b"*")]
+        return [(b"access-control-allow-origin", origin), (b"vary", b"Origin")]
+
+    def _host_allowed(self, host: bytes | None) -> bool:
+        """Whether a Host header (port ignored) matches allowed_hosts"""
+        if host is None:
+            return False
+        host = host.split(b":", 1)[0]
+        return host in self.hosts or host.endswith(self.host_suffixes)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        host = origin = request_method = request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"host":
+                host = value
+            elif name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if not self.any_host and not self._host_allowed(host):
+            if scope["type"] == "websocket":
+                await send({"type": "websocket.close", "code": 1008})
+            else:
+                await _send_plain(send, 400, b"Invalid host header")
+            return
+
+        if scope["type"] == "websocket" or origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        allowed = self.any_origin or origin in self.origins
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            if not allowed:
+                await _send_plain(send, 400, b"Disallowed CORS origin")
+                return
+            headers = [*self._origin_headers(origin), *self._preflight_headers]
+            if request_headers is not None:
+                headers.append((b"access-control-allow-headers", request_headers))
+            await _send_plain(send, 200, b"OK", headers)
+            return
+
+        if not allowed:
+            await self.app(scope, receive, send)
+            return
+
+        cors_headers = [*self._origin_headers(origin), *self._simple_headers]
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                # Build a new list: prebuilt responses share theirs
+                message = {
+                    **message,
+                    "headers": [*message.get("headers", ()), *cors_headers],
+                }
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+
+async def _send_plain(send, status_code: int, body: bytes, headers=()):
+    """Send a complete text/plain response straight over ASGI"""
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [
+                (b"content-type", b"text/plain; charset=utf-8"),
+                (b"content-length", str(len(body)).encode()),
+                *headers,
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+# CORS and trusted-host checks with φ-optimized settings
 app.add_middleware(
-    CORSMiddleware,
+    CompactCorsHost,
     allow_origins=["*"],  # In production, specify actual origins
+    allowed_hosts=["*"],  # In production, specify actual hosts
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
     max_age=int(600 * PHI),  # φ-optimized preflight cache: ~971 seconds
 )
 
-# Add trusted host middleware for security
-app.add_middleware(
-    TrustedHostMiddleware,
-    allowed_hosts=["*"],  # In production, specify actual hosts
-)
-
 
 # Include API endpoints
 if ENDPOINTS_AVAILABLE and router:
@@ -183,11 +429,48 @@ else:
 
 # Initialize core components (avoid global variables by using app.state)
 # Initialized in startup_event
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 security = HTTPBearer()
 
-# Rate limiting storage (in production, use Redis)
-rate_limit_storage: Dict[str, List[float]] = {}
+
+# In-process rate limiting storage, used when REDIS_URL is unset or Redis is
+# unreachable. Split into shards by client hash, each guarded by its own lock,
+# so concurrent updates (threadpool routes, free-threaded builds) only contend
+# within a shard. Token bucket: client -> (scaled_tokens, last_refill_ns);
+# sliding window: client -> (previous_count, current_count, window_index)
+RATE_LIMIT_SHARDS = 16  # Power of two so the shard index is a bit mask
+rate_limit_shards: list[dict[str, tuple[int, int]]] = [
+    {} for _ in range(RATE_LIMIT_SHARDS)
+]
+sliding_window_shards: list[dict[str, tuple[int, int, int]]] = [
+    {} for _ in range(RATE_LIMIT_SHARDS)
+]
+_rate_limit_locks = [threading.Lock() for _ in range(RATE_LIMIT_SHARDS)]
+
+
+def _shard_index(client_ip: str) -> int:
+    """Shard holding a client's rate-limit state"""
+    return hash(client_ip) & (RATE_LIMIT_SHARDS - 1)
+
+
+# Same token bucket as check_rate_limit, run atomically inside Redis so every
+# worker and instance shares one bucket per client.
+# ARGV: capacity, refill rate (tokens/s), key TTL (ms), now (s)
+RATE_LIMIT_LUA = """
+local bucket = redis.call('HMGET', KEYS[1], 'tok', 'ts')
+local capacity = tonumber(ARGV[1])
+local now = tonumber(ARGV[4])
+local tokens = tonumber(bucket[1]) or capacity
+local last = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - last) * tonumber(ARGV[2]))
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tok', tostring(tokens), 'ts', ARGV[4])
+redis.call('PEXPIRE', KEYS[1], ARGV[3])
+return allowed
+"""
 
 
 # Pydantic models for API requests/responses
@@ -212,7 +495,7 @@ class PluginInfo(BaseModel):
     author: str = Field(..., description="Plugin author")
     sacred_geometry_score: float = Field(..., description="Plugin φ-compliance score")
     loaded: bool = Field(..., description="Plugin load status")
-    performance_metrics: Dict[str, Any] = Field(
+    performance_metrics: dict[str, Any] = Field(
         default_factory=dict, description="Performance data"
     )
 
@@ -221,13 +504,13 @@ class PluginExecutionRequest(BaseModel):
     """Plugin execution request model"""
 
     plugin_name: str = Field(..., description="Name of plugin to execute")
-    input_data: Optional[Dict[str, Any]] = Field(
+    input_data: dict[str, Any] | None = Field(
         default=None, description="Input data for plugin"
     )
-    parameters: Optional[Dict[str, Any]] = Field(
+    parameters: dict[str, Any] | None = Field(
         default=None, description="Additional parameters"
     )
-    timeout: Optional[float] = Field(
+    timeout: float | None = Field(
         default=None, description="Execution timeout (φ-optimized)"
     )
 
@@ -236,12 +519,12 @@ class PluginExecutionResponse(BaseModel):
     """Plugin execution response model"""
 
     success: bool = Field(..., description="Execution success status")
-    result: Optional[Dict[str, Any]] = Field(
+    result: dict[str, Any] | None = Field(
         default=None, description="Plugin execution result"
     )
     execution_time: float = Field(..., description="Execution time in seconds")
     sacred_geometry_score: float = Field(..., description="Result φ-compliance score")
-    error_message: Optional[str] = Field(
+    error_message: str | None = Field(
         default=None, description="Error message if failed"
     )
 
@@ -262,37 +545,52 @@ class UserLogin(BaseModel):
     password: str = Field(..., description="Password")
 
 
+def encode_message(message: dict[str, Any]) -> str:
+    """Serialize a WebSocket message once with orjson, as a text-frame payload"""
+    return orjson.dumps(message).decode("utf-8")
+
+
 # WebSocket connection manager
 class ConnectionManager:
     """WebSocket connection manager with Sacred Geometry optimization"""
 
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
-        self.connection_count = 0
+        # id -> weak reference: the endpoint coroutine owns the socket, so one
+        # closed out from under us is reclaimed even if disconnect never runs
+        self.active_connections: dict[int, weakref.ref] = {}
+        self._pending: list[dict[str, Any]] = []
+        self._flush_task: asyncio.Task | None = None  # Armed while _pending fills
         self.phi_heartbeat_interval = 30 * PHI  # φ-optimized heartbeat: ~48.5 seconds
 
+    @property
+    def connection_count(self) -> int:
+        """Number of active WebSocket connections"""
+        return len(self.active_connections)
+
     async def connect(self, websocket: WebSocket):
         """Accept WebSocket connection"""
         await websocket.accept()
-        self.active_connections.append(websocket)
-        self.connection_count += 1
+        self.active_connections[id(websocket)] = weakref.ref(websocket)
         logger.info("WebSocket connected. Total connections: %d", self.connection_count)
 
     def disconnect(self, websocket: WebSocket):
         """Remove WebSocket connection"""
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-            self.connection_count = max(0, self.connection_count - 1)
+        if self.active_connections.pop(id(websocket), None) is not None:
             logger.info(
                 "WebSocket disconnected. Total connections: %d", self.connection_count
             )
 
     async def send_personal_message(
-        self, message: Dict[str, Any], websocket: WebSocket
+        self, message: dict[str, Any] | str, websocket: WebSocket
     ):
-        """Send message to specific WebSocket"""
+        """Send message to specific WebSocket
+
+        Accepts a payload already serialized with ``encode_message`` so the
+        same message sent to several peers is only encoded once.
+        """
+        payload = message if isinstance(message, str) else encode_message(message)
         try:
-            await websocket.send_json(message)
+            await websocket.send_text(payload)
         except (ConnectionResetError, ConnectionAbortedError) as e:
             logger.error("WebSocket connection error: %s", e)
             self.disconnect(websocket)
@@ -301,23 +599,62 @@ class ConnectionManager:
             logger.error("Failed to send WebSocket message: %s", e)
             self.disconnect(websocket)
 
-    async def broadcast(self, message: Dict[str, Any]):
-        """Broadcast message to all connected WebSockets"""
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except (ConnectionResetError, ConnectionAbortedError) as e:
-                logger.error("WebSocket connection error during broadcast: %s", e)
-                disconnected.append(connection)
-            except Exception as e:  # pylint: disable=broad-except
-                # Broad exception needed for various WebSocket errors
-                logger.error("Failed to broadcast to WebSocket: %s", e)
-                disconnected.append(connection)
+    async def broadcast(self, message: dict[str, Any]):
+        """Queue a message for the next coalesced broadcast"""
+        self._pending.append(message)
+        if len(self._pending) >= BROADCAST_BATCH_MAX:
+            await self.flush()
+        elif self._flush_task is None:
+            # The first queued message arms a single delayed flush, so an idle
+            # manager has no timer running at all
+            self._flush_task = asyncio.create_task(self._flush_after_interval())
+
+    async def _flush_after_interval(self):
+        """Flush once, BROADCAST_FLUSH_INTERVAL after the first queued message"""
+        await asyncio.sleep(BROADCAST_FLUSH_INTERVAL)
+        self._flush_task = None
+        await self.flush()
+
+    async def close(self):
+        """Cancel the armed flush and send whatever is still queued"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self.flush()
+
+    async def flush(self):
+        """Send queued broadcasts as one frame per connection"""
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+
+        # Serialize once for every recipient; text frames because the
+        # dashboards JSON.parse event.data. A lone message goes out as-is,
+        # several as the {"type": "multi"} frame websockets.py also sends
+        payload = encode_message(
+            batch[0] if len(batch) == 1 else {"type": "multi", "items": batch}
+        )
+
+        # Send concurrently so fan-out latency tracks the slowest client
+        # instead of the sum of all of them; snapshot the live sockets
+        # because connects/disconnects during the awaits mutate the map
+        connections = []
+        for key, ref in tuple(self.active_connections.items()):
+            connection = ref()
+            if connection is None:
+                del self.active_connections[key]  # Prune collected sockets
+            else:
+                connections.append(connection)
+        results = await asyncio.gather(
+            *(connection.send_text(payload) for connection in connections),
+            return_exceptions=True,
+        )
 
         # Clean up disconnected WebSockets
-        for connection in disconnected:
-            self.disconnect(connection)
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to broadcast to WebSocket: %s", result)
+                self.disconnect(connection)
 
 
 # Initialize WebSocket manager
@@ -326,28 +663,48 @@ manager = ConnectionManager()
 
 # Authentication and security functions
 def create_access_token(
-    data: Dict[str, Any], expires_delta: Optional[timedelta] = None
+    data: dict[str, Any], expires_delta: timedelta | None = None
 ) -> str:
     """Create JWT access token with φ-optimization"""
     to_encode = data.copy()
 
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
-
-    to_encode.update({"exp": expire, "phi_optimized": True})
-    encoded_jwt = jwt.encode(to_encode, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
+    # JWT exp is a Unix timestamp, so plain epoch arithmetic replaces the
+    # utcnow() + timedelta datetime construction
+    lifetime = (
+        int(expires_delta.total_seconds())
+        if expires_delta
+        else JWT_ACCESS_TOKEN_EXPIRE_SECONDS
+    )
+    to_encode.update({"exp": int(time.time()) + lifetime, "phi_optimized": True})
+    if JWT_SIGNING_KEY is None:
+        raise RuntimeError("JWT_PRIVATE_KEY not set; this instance only verifies")
+    encoded_jwt = jwt.encode(to_encode, JWT_SIGNING_KEY, algorithm=JWT_ALGORITHM)
     return encoded_jwt
 
 
+# Decoded payloads keyed by a 16-byte BLAKE2b digest of the raw token, so a
+# burst of requests with the same token skips the signature check and JSON
+# parse; each hit is still checked against the token's own exp
+_token_cache: TTLCache = TTLCache(maxsize=10000, ttl=60)
+
+
+def _token_cache_key(token: str) -> bytes:
+    """Compact cache key for a raw bearer token"""
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+
 async def verify_token(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-) -> Dict[str, Any]:
+) -> dict[str, Any]:
     """Verify JWT token with Sacred Geometry validation"""
+    cache_key = _token_cache_key(credentials.credentials)
+    cached = _token_cache.get(cache_key)
+    if cached is not None and cached["exp"] > time.time():
+        return cached
+
     try:
         payload = jwt.decode(
-            credentials.credentials, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM]
+            credentials.credentials, JWT_VERIFY_KEY, algorithms=[JWT_ALGORITHM]
         )
 
         # Verify φ-optimization flag
@@ -358,6 +715,8 @@ async def verify_token(
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
+        if "exp" in payload:
+            _token_cache[cache_key] = payload
         return payload
 
     except jwt.ExpiredSignatureError as exc:
@@ -366,7 +725,7 @@ async def verify_token(
             detail="Token expired",
             headers={"WWW-Authenticate": "Bearer"},
         ) from exc
-    except jwt.JWTError as exc:
+    except jwt.InvalidTokenError as exc:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
@@ -374,26 +733,92 @@ async def verify_token(
         ) from exc
 
 
-async def check_rate_limit(client_ip: str) -> bool:
-    """Check rate limit with φ-based intervals"""
-    current_time = time.time()
+def _check_rate_limit_local(client_ip: str) -> bool:
+    """Per-process φ-sized token bucket (O(1) per request)"""
+    index = _shard_index(client_ip)
+    storage = rate_limit_shards[index]
+    with _rate_limit_locks[index]:
+        now_ns = time.monotonic_ns()
+        tokens, last_refill_ns = storage.get(
+            client_ip, (RATE_LIMIT_CAPACITY_SCALED, now_ns)
+        )
+
+        # Refill for the time elapsed since the last request, capped at capacity
+        tokens = min(
+            RATE_LIMIT_CAPACITY_SCALED,
+            tokens + (now_ns - last_refill_ns) * RATE_LIMIT_REQUESTS,
+        )
+        if tokens < RATE_LIMIT_TOKEN_COST:
+            storage[client_ip] = (tokens, now_ns)
+            return False
+
+        storage[client_ip] = (tokens - RATE_LIMIT_TOKEN_COST, now_ns)
+        return True
+
+
+def _check_sliding_window(client_ip: str) -> bool:
+    """Per-process sliding-window counter weighted by the previous window"""
+    index = _shard_index(client_ip)
+    storage = sliding_window_shards[index]
+    with _rate_limit_locks[index]:
+        now_ns = time.monotonic_ns()
+        window_index, elapsed_ns = divmod(now_ns, RATE_LIMIT_WINDOW_NS)
+        previous, current, stored_index = storage.get(client_ip, (0, 0, window_index))
+
+        if stored_index == window_index - 1:
+            previous, current = current, 0  # Roll the finished window back
+        elif stored_index != window_index:
+            previous, current = 0, 0  # Idle for more than a full window
+
+        # The previous window counts in proportion to how much of it still
+        # overlaps the trailing window; scaled by the window length in ns:
+        # current + previous * (1 - elapsed/W) >= limit, in integers
+        weighted = current * RATE_LIMIT_WINDOW_NS + previous * (
+            RATE_LIMIT_WINDOW_NS - elapsed_ns
+        )
+        if weighted >= RATE_LIMIT_CAPACITY_SCALED:
+            storage[client_ip] = (previous, current, window_index)
+            return False
 
-    if client_ip not in rate_limit_storage:
-        rate_limit_storage[client_ip] = []
+        storage[client_ip] = (previous, current + 1, window_index)
+        return True
+
+
+async def _check_rate_limit_redis(redis_client, client_ip: str) -> bool:
+    """Shared token bucket: one EVALSHA round-trip per request"""
+    args = (
+        RATE_LIMIT_CAPACITY,
+        RATE_LIMIT_REFILL_RATE,
+        RATE_LIMIT_WINDOW * 1000,  # An idle bucket is full again after one window
+        time.time(),
+    )
+    key = f"rl:{client_ip}"
+    try:
+        allowed = await redis_client.evalsha(
+            app.state.rate_limit_script_sha, 1, key, *args
+        )
+    except NoScriptError:
+        # Script cache was flushed (e.g. Redis restart); load it again
+        app.state.rate_limit_script_sha = await redis_client.script_load(RATE_LIMIT_LUA)
+        allowed = await redis_client.evalsha(
+            app.state.rate_limit_script_sha, 1, key, *args
+        )
+    return allowed == 1
 
-    # Clean old requests (outside φ-optimized window)
-    cutoff_time = current_time - RATE_LIMIT_WINDOW
-    rate_limit_storage[client_ip] = [
-        req_time for req_time in rate_limit_storage[client_ip] if req_time > cutoff_time
-    ]
 
-    # Check if within rate limit
-    if len(rate_limit_storage[client_ip]) >= RATE_LIMIT_REQUESTS:
-        return False
+async def check_rate_limit(client_ip: str) -> bool:
+    """Check rate limit with φ-based intervals"""
+    if RATE_LIMIT_STRATEGY == "sliding_window":
+        # Strict-count mode is per-process; the Redis script is a token bucket
+        return _check_sliding_window(client_ip)
 
-    # Add current request
-    rate_limit_storage[client_ip].append(current_time)
-    return True
+    redis_client = app.state.redis
+    if redis_client is not None:
+        try:
+            return await _check_rate_limit_redis(redis_client, client_ip)
+        except (RedisError, OSError) as e:
+            logger.warning("Redis rate limit unavailable, using local limit: %s", e)
+    return _check_rate_limit_local(client_ip)
 
 
 # Startup and shutdown events
@@ -419,6 +844,28 @@ async def startup_event():
                 len(plugin_results),
             )
 
+        # Connect the shared rate-limit store and cache the bucket script
+        if REDIS_URL and REDIS_AVAILABLE:
+            try:
+                redis_client = aioredis.from_url(REDIS_URL)
+                app.state.rate_limit_script_sha = await redis_client.script_load(
+                    RATE_LIMIT_LUA
+                )
+                app.state.redis = redis_client
+                logger.info("Redis rate limiting enabled")
+            except (RedisError, OSError) as e:
+                logger.warning("Redis unavailable, using in-process rate limit: %s", e)
+        elif REDIS_URL:
+            logger.warning("REDIS_URL set but redis package not installed")
+
+        # PyJWT's HS256 is hmac.new(..., hashlib.sha256); confirm that resolves
+        # to the OpenSSL implementation (SHA-NI / ARMv8 SHA2 where available)
+        logger.info(
+            "JWT HMAC backend: %s (%s)", hashlib.sha256.__name__, ssl.OPENSSL_VERSION
+        )
+        if not hashlib.sha256.__name__.startswith("openssl_"):
+            logger.warning("hashlib is not OpenSSL-backed; JWT signing is slower")
+
         logger.info("🌟 AAR API System started with Sacred Geometry optimization")
 
     except Exception as e:
@@ -435,6 +882,12 @@ async def shutdown_event():
             app.state.plugin_manager.shutdown()
             logger.info("Plugin manager shutdown complete")
 
+        await manager.close()
+
+        if app.state.redis is not None:
+            await app.state.redis.aclose()
+            app.state.redis = None
+
         logger.info("🔺 AAR API System shutdown complete")
 
     except Exception as e:  # pylint: disable=broad-except
@@ -443,7 +896,7 @@ async def shutdown_event():
 
 
 # API Routes
-@app.get("/", response_model=Dict[str, Any])
+@app.get("/", response_model=None)
 async def root():
     """Root endpoint with Sacred Geometry information"""
     return {
@@ -463,36 +916,55 @@ async def root():
     }
 
 
+# Computed status metrics, shared by every request within a 1 s window so
+# high-frequency health checks don't walk the plugin registry each time
+_status_cache: TTLCache = TTLCache(maxsize=1, ttl=1)
+
+
+def _compute_status_metrics() -> dict[str, Any]:
+    """Plugin/connection counts and the φ-based health score"""
+    # Calculate Sacred Geometry score based on system health
+    plugin_count = (
+        len(app.state.plugin_manager.get_available_plugins())
+        if app.state.plugin_manager
+        else 0
+    )
+    active_connections = manager.connection_count
+
+    # φ-based scoring algorithm
+    base_score = 0.618  # Base φ ratio
+    plugin_score = min(plugin_count * 0.1, 0.5)  # Plugin contribution
+    connection_score = min(active_connections * 0.05, 0.3)  # Connection contribution
+    sacred_geometry_score = min(
+        (base_score + plugin_score + connection_score) * PHI, PHI
+    )
+
+    return {
+        "status": "operational",
+        "sacred_geometry_score": sacred_geometry_score,
+        "phi_constant": PHI,
+        "plugin_count": plugin_count,
+        "active_connections": active_connections,
+    }
+
+
 @app.get("/api/v1/system/status", response_model=SystemStatusResponse)
 async def get_system_status():
     """Get comprehensive system status with Sacred Geometry metrics"""
     try:
-        # Calculate Sacred Geometry score based on system health
-        plugin_count = (
-            len(app.state.plugin_manager.get_available_plugins())
-            if app.state.plugin_manager
-            else 0
-        )
-        active_connections = manager.connection_count
-
-        # φ-based scoring algorithm
-        base_score = 0.618  # Base φ ratio
-        plugin_score = min(plugin_count * 0.1, 0.5)  # Plugin contribution
-        connection_score = min(
-            active_connections * 0.05, 0.3
-        )  # Connection contribution
-        sacred_geometry_score = min(
-            (base_score + plugin_score + connection_score) * PHI, PHI
-        )
-
-        return SystemStatusResponse(
-            status="operational",
-            timestamp=time.time(),
-            sacred_geometry_score=sacred_geometry_score,
-            uptime_seconds=time.time() - app.state.startup_time,
-            plugin_count=plugin_count,
-            active_connections=active_connections,
-        )
+        metrics = _status_cache.get("status")
+        if metrics is None:
+            metrics = _status_cache["status"] = _compute_status_metrics()
+
+        # Plain dict: response_model validates and serializes it in one pass,
+        # instead of building a model here and re-validating it on the way out;
+        # the time fields are always fresh
+        now = time.time()
+        return {
+            **metrics,
+            "timestamp": now,
+            "uptime_seconds": now - app.state.startup_time,
+        }
 
     except Exception as e:
         logger.error("Failed to get system status: %s", e)
@@ -503,12 +975,20 @@ async def get_system_status():
 
 
 if __name__ == "__main__":
-    # Development server with φ-optimized settings
+    # Production-style server: C-accelerated event loop (asyncio on Windows,
+    # where uvloop has no build) and HTTP parser; scale with WEB_CONCURRENCY
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
-        port=int(8000 * PHI / PHI),  # Port 8000 (φ-neutral)
-        reload=True,
-        workers=1,
-        log_level="info",
+        port=8000,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=int(os.environ.get("WEB_CONCURRENCY", 1)),
+        reload=False,
+        log_level="warning",
+        # Bound per-connection WebSocket buffers and reap dead peers
+        ws_max_size=64 * 1024,
+        ws_ping_interval=30,
+        ws_ping_timeout=10,
+        ws_per_message_deflate=True,
     )
@@ -1,6 +1,8 @@
 """API Models Module"""
 
-from typing import Any, Dict, Optional
+from __future__ import annotations
+
+from typing import Any
 
 from pydantic import BaseModel, Field
 
@@ -30,7 +32,7 @@ class PluginInfo(BaseModel):
     author: str = Field(..., description="Plugin author")
     sacred_geometry_score: float = Field(..., description="Plugin φ-compliance score")
     loaded: bool = Field(..., description="Plugin load status")
-    performance_metrics: Dict[str, Any] = Field(
+    performance_metrics: dict[str, Any] = Field(
         default_factory=dict, description="Performance data"
     )
 
@@ -39,13 +41,13 @@ class PluginExecutionRequest(BaseModel):
     """Plugin execution request model"""
 
     plugin_name: str = Field(..., description="Name of plugin to execute")
-    input_data: Optional[Dict[str, Any]] = Field(
+    input_data: dict[str, Any] | None = Field(
         default=None, description="Input data for plugin"
     )
-    parameters: Optional[Dict[str, Any]] = Field(
+    parameters: dict[str, Any] | None = Field(
         default=None, description="Additional parameters"
     )
-    timeout: Optional[float] = Field(
+    timeout: float | None = Field(
         default=None, description="Execution timeout (φ-optimized)"
     )
 
@@ -54,11 +56,11 @@ class PluginExecutionResponse(BaseModel):
     """Plugin execution response model"""
 
     success: bool = Field(..., description="Execution success status")
-    result: Optional[Dict[str, Any]] = Field(
+    result: dict[str, Any] | None = Field(
         default=None, description="Plugin execution result"
     )
     execution_time: float = Field(..., description="Execution time in seconds")
     sacred_geometry_score: float = Field(..., description="Result φ-compliance score")
-    error_message: Optional[str] = Field(
+    error_message: str | None = Field(
         default=None, description="Error message if failed"
     )
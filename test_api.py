@@ -2,6 +2,7 @@
 
 import os
 import sys
+import time
 import unittest
 
 from fastapi.testclient import TestClient
@@ -9,6 +10,8 @@ from fastapi.testclient import TestClient
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from api import main
+from api.endpoints import verify_token
 from api.main import app
 
 
@@ -67,6 +70,81 @@ class TestAARAPI(unittest.TestCase):
         self.assertTrue(result["success"])
         self.assertGreater(result["sacred_geometry_score"], 0)
 
+    def test_plugins_etag(self):
+        """Test conditional GET on the static plugin listing"""
+        app.dependency_overrides[verify_token] = lambda: {"sub": "admin"}
+        try:
+            response = self.client.get("/api/v1/plugins")
+            self.assertEqual(response.status_code, 200)
+            etag = response.headers["etag"]
+
+            response = self.client.get(
+                "/api/v1/plugins", headers={"If-None-Match": etag}
+            )
+            self.assertEqual(response.status_code, 304)
+            self.assertEqual(response.content, b"")
+
+            # Weak validators and tag lists are matched too
+            for header in (f"W/{etag}", f'"stale", {etag}', "*"):
+                response = self.client.get(
+                    "/api/v1/plugins", headers={"If-None-Match": header}
+                )
+                self.assertEqual(response.status_code, 304, header)
+            response = self.client.get(
+                "/api/v1/plugins", headers={"If-None-Match": '"stale"'}
+            )
+            self.assertEqual(response.status_code, 200)
+        finally:
+            app.dependency_overrides.clear()
+
+    def test_cors_preflight(self):
+        """Test that CORS preflight is answered without reaching the routes"""
+        response = self.client.options(
+            "/api/v1/auth/login",
+            headers={
+                "Origin": "https://dashboard.example",
+                "Access-Control-Request-Method": "POST",
+                "Access-Control-Request-Headers": "content-type",
+            },
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.headers["access-control-allow-origin"],
+            "https://dashboard.example",
+        )
+        self.assertEqual(
+            response.headers["access-control-allow-headers"], "content-type"
+        )
+        self.assertEqual(response.headers["access-control-allow-credentials"], "true")
+
+    def test_trusted_host_wildcard(self):
+        """Test that "*.example.com" allowed hosts match subdomains only"""
+        guarded = main.CompactCorsHost(
+            app, allow_origins=[], allowed_hosts=["*.example.com"]
+        )
+        allowed = TestClient(guarded, base_url="http://api.example.com:8000")
+        self.assertEqual(allowed.get("/").status_code, 200)
+        for host in ("example.com", "api.example.org"):
+            client = TestClient(guarded, base_url=f"http://{host}")
+            self.assertEqual(client.get("/").status_code, 400)
+
+        with self.assertRaises(ValueError):
+            main.CompactCorsHost(app, allow_origins=[], allowed_hosts=["api.*.com"])
+
+    def test_rate_limit_rejects_drained_client(self):
+        """Test that the rate-limit middleware answers 429 for an empty bucket"""
+        ip = "203.0.113.7"
+        shard = main.rate_limit_shards[main._shard_index(ip)]
+        shard[ip] = (0, time.monotonic_ns())  # Bucket drained just now
+        try:
+            client = TestClient(app, client=(ip, 50000))
+            response = client.get("/")
+            self.assertEqual(response.status_code, 429)
+            self.assertEqual(response.json(), {"detail": "Rate limit exceeded"})
+            self.assertIn("retry-after", response.headers)
+        finally:
+            shard.pop(ip, None)
+
     def test_unauthorized_access(self):
         """Test unauthorized access attempts"""
         # Try accessing protected endpoint without token
@@ -17,18 +17,16 @@ sys.path.insert(0, str(api_dir))
 def test_syntax_validation():
     """Test that main.py has valid Python syntax"""
     try:
-        import ast
+        import py_compile
 
         main_py_path = api_dir / "main.py"
 
-        with open(main_py_path, "r", encoding="utf-8") as f:
-            source_code = f.read()
-
-        # Parse the AST to validate syntax
-        ast.parse(source_code)
+        # Compiling validates syntax and writes the .pyc that the import
+        # validation below then loads instead of parsing main.py again
+        py_compile.compile(str(main_py_path), doraise=True)
         print("✅ Syntax validation passed")
         return True
-    except SyntaxError as e:
+    except py_compile.PyCompileError as e:
         print(f"❌ Syntax error: {e}")
         return False
     except Exception as e:
@@ -0,0 +1,195 @@
+"""Test AAR WebSocket Manager"""
+
+import asyncio
+import os
+import sys
+import unittest
+
+import orjson
+from fastapi.websockets import WebSocketState
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api import websockets as aar_ws
+
+
+class FakeWebSocket:
+    """Records frames and closes instead of talking to a peer"""
+
+    def __init__(self):
+        self.client_state = WebSocketState.CONNECTED
+        self.frames = []
+        self.close_code = None
+
+    async def accept(self):
+        pass
+
+    async def close(self, code=1000, reason=None):  # pylint: disable=unused-argument
+        self.client_state = WebSocketState.DISCONNECTED
+        self.close_code = code
+
+    async def send_text(self, data):
+        self.frames.append(orjson.loads(data))
+
+    async def send_bytes(self, data):
+        self.frames.append(data)
+
+
+class StalledWebSocket(FakeWebSocket):
+    """A peer that never finishes receiving, so its writer stays blocked"""
+
+    async def send_text(self, data):
+        await asyncio.Event().wait()
+
+
+class BrokenWebSocket(FakeWebSocket):
+    """A socket whose send fails with something other than a disconnect"""
+
+    async def send_text(self, data):
+        raise ValueError("unexpected")
+
+
+class TestWebSocketManager(unittest.IsolatedAsyncioTestCase):
+    """Test WebSocketManager connection bookkeeping and delivery"""
+
+    async def asyncSetUp(self):
+        """Fresh manager per test; the heartbeat loop is never started"""
+        self.manager = aar_ws.WebSocketManager()
+
+    async def asyncTearDown(self):
+        for client_id in list(self.manager._ids):
+            await self.manager.disconnect(client_id)
+
+    async def _connect(self, client_id):
+        """Connect a fake socket and let its writer send the welcome"""
+        websocket = FakeWebSocket()
+        self.assertTrue(await self.manager.connect(websocket, client_id))
+        await self._drain()
+        return websocket
+
+    @staticmethod
+    async def _drain():
+        """Give the writer tasks a chance to empty their queues"""
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+    def _assert_index_consistent(self, expected_ids):
+        manager = self.manager
+        self.assertEqual(set(manager._ids), set(expected_ids))
+        self.assertEqual(len(manager._ids), len(manager._sockets))
+        self.assertEqual(len(manager._ids), len(manager._info))
+        self.assertEqual(set(manager._idx), set(expected_ids))
+        for client_id, index in manager._idx.items():
+            self.assertEqual(manager._ids[index], client_id)
+
+    async def test_remove_keeps_index_consistent(self):
+        """Test that swap-pop removal from the middle and end keeps _idx valid"""
+        sockets = {cid: await self._connect(cid) for cid in ("a", "b", "c", "d")}
+
+        await self.manager.disconnect("b")  # Middle: "d" moves into its slot
+        self._assert_index_consistent({"a", "c", "d"})
+        await self.manager.disconnect("d")  # Now last: plain pop
+        self._assert_index_consistent({"a", "c"})
+        self.assertEqual(sockets["b"].client_state, WebSocketState.DISCONNECTED)
+
+        # The surviving slots still deliver to their own sockets
+        await self.manager.send_personal_message("c", {"type": "probe"})
+        await self._drain()
+        self.assertEqual(sockets["c"].frames[-1]["type"], "probe")
+        self.assertEqual(sockets["a"].frames[-1]["type"], "connection_established")
+
+    async def test_duplicate_client_id_refused(self):
+        """Test that a second connection with a live client_id is closed 1008"""
+        first = await self._connect("dup")
+        second = FakeWebSocket()
+
+        self.assertFalse(await self.manager.connect(second, "dup"))
+        self.assertEqual(second.close_code, 1008)
+        self.assertIs(self.manager._sockets[self.manager._idx["dup"]], first)
+        self._assert_index_consistent({"dup"})
+
+    async def test_full_queue_disconnects_client(self):
+        """Test that a client too far behind is evicted instead of buffered"""
+        stalled = StalledWebSocket()
+        self.assertTrue(await self.manager.connect(stalled, "slow"))
+        await self._drain()  # The writer now blocks sending the welcome
+
+        for _ in range(aar_ws.OUTBOUND_QUEUE_SIZE):
+            self.assertTrue(await self.manager.send_personal_message("slow", {}))
+        self.assertFalse(await self.manager.send_personal_message("slow", {}))
+
+        self.assertNotIn("slow", self.manager._idx)
+        self.assertEqual(stalled.client_state, WebSocketState.DISCONNECTED)
+        self._assert_index_consistent(set())
+
+    async def test_queued_messages_coalesce_into_multi_frame(self):
+        """Test that messages queued before a writer wakes share one frame"""
+        websocket = await self._connect("c1")
+        websocket.frames.clear()
+
+        # None of these awaits yields, so all three are queued before the
+        # writer runs again
+        for n in range(3):
+            await self.manager.send_personal_message("c1", {"type": "tick", "n": n})
+        await self._drain()
+
+        self.assertEqual(len(websocket.frames), 1)
+        frame = websocket.frames[0]
+        self.assertEqual(frame["type"], "multi")
+        self.assertEqual([item["n"] for item in frame["items"]], [0, 1, 2])
+
+    @unittest.skipUnless(aar_ws.MSGPACK_AVAILABLE, "msgpack not installed")
+    async def test_binary_client_receives_msgpack(self):
+        """Test that a hello-negotiated client gets msgpack, others keep JSON"""
+        unpackb = aar_ws.msgpack.unpackb
+        binary_ws = await self._connect("bin")
+        text_ws = await self._connect("txt")
+        self.assertTrue(self.manager.set_binary("bin", True))
+
+        await self.manager.broadcast({"type": "news", "content": "hi"})
+        await self._drain()
+
+        frame = binary_ws.frames[-1]
+        self.assertIsInstance(frame, bytes)
+        self.assertEqual(unpackb(frame)["type"], "broadcast")
+        self.assertEqual(text_ws.frames[-1]["type"], "broadcast")
+
+        # Text queued before the switch and binary after it go out as
+        # separate runs, each in its own frame kind
+        await self.manager.send_personal_message("txt", {"type": "one"})
+        self.manager.set_binary("txt", True)
+        await self.manager.send_personal_message("txt", {"type": "two"})
+        await self._drain()
+        self.assertEqual(text_ws.frames[-2]["type"], "one")
+        self.assertEqual(unpackb(text_ws.frames[-1])["type"], "two")
+
+    async def test_unexpected_send_error_disconnects(self):
+        """Test that a writer failing with a non-socket error drops its client"""
+        broken = BrokenWebSocket()
+        self.assertTrue(await self.manager.connect(broken, "broken"))
+        await self._drain()  # The writer fails on the welcome frame
+
+        self.assertNotIn("broken", self.manager._idx)
+        self.assertEqual(broken.client_state, WebSocketState.DISCONNECTED)
+
+    async def test_heartbeat_keeps_broadcast_shape(self):
+        """Test that spliced heartbeats match the broadcast() envelope"""
+        websocket = await self._connect("hb")
+        self.manager.heartbeat_interval = 0.01
+        await self.manager.start()
+        try:
+            await asyncio.sleep(0.05)
+        finally:
+            await self.manager.stop()
+
+        heartbeat = websocket.frames[-1]
+        self.assertEqual(heartbeat["type"], "broadcast")
+        self.assertEqual(heartbeat["server_timestamp"], heartbeat["server_time"])
+        self.assertEqual(heartbeat["connection_count"], 1)
+        self.assertEqual(heartbeat["active_connections"], 1)
+        self.assertEqual(heartbeat["phi_interval"], 0.01)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,12 +8,28 @@ with Sacred Geometry principles for optimal data streaming.
 
 import math
 import asyncio
+import functools
+import itertools
 
 # Add modules path for AAR system integration
 import sys
 import time
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import orjson
+
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:  # Optional; clients then always get JSON text frames
+    MSGPACK_AVAILABLE = False
+
+try:
+    import uvloop
+except ImportError:  # Optional (no Windows build); asyncio's loop still works
+    uvloop = None
 
 try:
     from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect
@@ -46,26 +62,87 @@ except ImportError:
         return default
 
 
-modules_path = Path(__file__).parent.parent / "modules"
-sys.path.insert(0, str(modules_path))
-
+# Only touch sys.path when the shared modules aren't already importable
 try:
     from modules.utils.safe_logging import get_safe_logger
 except ImportError:
-    import logging
+    sys.path.insert(0, str(Path(__file__).parent.parent / "modules"))
+    try:
+        from modules.utils.safe_logging import get_safe_logger
+    except ImportError:
+        import logging
 
-    def get_safe_logger(name):
-        return logging.getLogger(name)
+        def get_safe_logger(name):
+            return logging.getLogger(name)
 
 
 # Sacred Geometry constants
 PHI = (1 + math.sqrt(5)) / 2
+
+# Each client gets an outbound queue drained by its own writer task, so a slow
+# socket never blocks the sender; a client this far behind is disconnected
+OUTBOUND_QUEUE_SIZE = 256
+# Messages already queued when a writer wakes are sent as one
+# {"type": "multi", "items": [...]} frame of at most this many items
+COALESCE_MAX_ITEMS = 64
+
+# What a socket operation raises when the peer has gone away: Starlette's
+# disconnect, the transport's OSError family, or RuntimeError for a send or
+# close on a socket that is already closed
+SOCKET_ERRORS = (WebSocketDisconnect, OSError, RuntimeError)
+
+# The msgpack encoding of {"type": "multi", "items": []} minus the empty-array
+# byte; a coalesced binary frame appends the array header and packed items
+_MULTI_BINARY_PREFIX = (
+    msgpack.packb({"type": "multi", "items": []})[:-1] if MSGPACK_AVAILABLE else b""
+)
+
 logger = get_safe_logger(__name__)
 
 # Create WebSocket router
 websocket_router = APIRouter()
 
 
+def _packb(message: Dict[str, Any]) -> bytes:
+    """Encode a message for a binary (msgpack) client"""
+    return msgpack.packb(message, use_bin_type=True)
+
+
+def _coalesce(items: List[Union[str, bytes]]) -> Union[str, bytes]:
+    """Merge same-kind payloads into one {"type": "multi"} frame, unencoded"""
+    if len(items) == 1:
+        return items[0]
+    if isinstance(items[0], bytes):
+        count = len(items)
+        if count < 16:
+            header = bytes((0x90 | count,))  # fixarray
+        else:
+            header = b"\xdc" + count.to_bytes(2, "big")  # array 16
+        return _MULTI_BINARY_PREFIX + header + b"".join(items)
+    return '{"type":"multi","items":[' + ",".join(items) + "]}"
+
+
+class ConnInfo:
+    """Per-connection bookkeeping, slotted to keep it small and fast to update"""
+
+    __slots__ = (
+        "queue",
+        "writer",
+        "connected_at",
+        "message_count",
+        "last_message_time",
+        "binary",
+    )
+
+    def __init__(self, queue: asyncio.Queue, writer: asyncio.Task):
+        self.queue = queue
+        self.writer = writer
+        self.connected_at = time.monotonic()  # Only used for durations
+        self.message_count = 0
+        self.last_message_time = time.time()
+        self.binary = False  # msgpack binary frames, negotiated by "hello"
+
+
 class WebSocketManager:
     """
     Enhanced WebSocket manager with Sacred Geometry optimization
@@ -79,45 +156,72 @@ class WebSocketManager:
     """
 
     def __init__(self):
-        self.active_connections: Dict[str, WebSocket] = {}
-        self.connection_metadata: Dict[str, Dict[str, Any]] = {}
+        # Parallel arrays indexed by slot, with _idx mapping client_id to its
+        # slot: fan-out walks contiguous lists and removal is a swap-pop.
+        # Slots move on removal, so never hold an index across an await
+        self._ids: List[str] = []
+        self._sockets: List[WebSocket] = []
+        self._info: List[ConnInfo] = []
+        self._idx: Dict[str, int] = {}
         self.heartbeat_interval = 30 * PHI  # φ-optimized heartbeat: ~48.5 seconds
         self.max_connections = int(100 * PHI)  # φ-optimized connection limit: ~162
         self.message_rate_limit = int(
             60 * PHI
         )  # φ-optimized message rate: ~97 per minute
         self.heartbeat_task = None
+        self._id_counter = itertools.count(1)
+
+    @property
+    def connection_count(self) -> int:
+        """Number of active WebSocket connections"""
+        return len(self._ids)
+
+    def set_binary(self, client_id: str, enabled: bool) -> bool:
+        """Switch a client's outbound frames to msgpack; returns the mode used"""
+
+        index = self._idx.get(client_id)
+        if index is None:
+            return False
+        self._info[index].binary = enabled and MSGPACK_AVAILABLE
+        return self._info[index].binary
+
+    def new_client_id(self) -> str:
+        """Unique ID for a client that did not supply one"""
+        return f"c{next(self._id_counter)}"
 
     async def connect(self, websocket: WebSocket, client_id: str):
         """Accept and manage WebSocket connection with φ-optimization"""
 
         # Check connection limits
-        if len(self.active_connections) >= self.max_connections:
+        if self.connection_count >= self.max_connections:
             await websocket.close(code=1008, reason="Connection limit exceeded")
             logger.warning("Connection limit exceeded for client %s", client_id)
             return False
 
+        if client_id in self._idx:
+            await websocket.close(code=1008, reason="Client ID already connected")
+            logger.warning("Duplicate WebSocket client ID rejected: %s", client_id)
+            return False
+
         try:
             await websocket.accept()
-            self.active_connections[client_id] = websocket
-            self.connection_metadata[client_id] = {
-                "connected_at": time.time(),
-                "message_count": 0,
-                "last_message_time": time.time(),
-                "sacred_geometry_score": 0.618,  # Initial φ-based score
-                "phi_optimized": True,
-            }
+            queue: asyncio.Queue = asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE)
+            self._idx[client_id] = len(self._ids)
+            self._ids.append(client_id)
+            self._sockets.append(websocket)
+            self._info.append(
+                ConnInfo(
+                    queue,
+                    asyncio.create_task(self._writer(client_id, websocket, queue)),
+                )
+            )
 
             logger.info(
                 "WebSocket connected: %s (Total: %d)",
                 client_id,
-                len(self.active_connections),
+                self.connection_count,
             )
 
-            # Start heartbeat if this is the first connection
-            if len(self.active_connections) == 1 and not self.heartbeat_task:
-                self.heartbeat_task = asyncio.create_task(self._heartbeat_loop())
-
             # Send welcome message with Sacred Geometry info
             await self.send_personal_message(
                 client_id,
@@ -133,142 +237,248 @@ class WebSocketManager:
 
             return True
 
-        except Exception as e:  # pylint: disable=broad-except
-            # Broad exception needed for WebSocket connection errors
-            logger.error("Failed to connect WebSocket for %s: %s", client_id, e)
+        except SOCKET_ERRORS as e:
+            logger.warning("Failed to connect WebSocket for %s: %s", client_id, e)
             return False
 
+    def _remove(self, client_id: str):
+        """Swap-pop a client's slot out of the parallel arrays"""
+
+        index = self._idx.pop(client_id)
+        last = len(self._ids) - 1
+        websocket, info = self._sockets[index], self._info[index]
+        if index != last:
+            moved = self._ids[last]
+            self._ids[index] = moved
+            self._sockets[index] = self._sockets[last]
+            self._info[index] = self._info[last]
+            self._idx[moved] = index
+        self._ids.pop()
+        self._sockets.pop()
+        self._info.pop()
+        return websocket, info
+
     async def disconnect(self, client_id: str):
         """Disconnect and cleanup WebSocket with proper lifecycle management"""
 
-        if client_id in self.active_connections:
-            websocket = self.active_connections[client_id]
+        if client_id in self._idx:
+            # Remove first, before any await, so a concurrent disconnect of
+            # the same client finds nothing to do
+            websocket, info = self._remove(client_id)
+
+            # Stop the writer, unless it is the one disconnecting after a
+            # failed send; queued messages are dropped with the connection
+            if info.writer is not asyncio.current_task():
+                info.writer.cancel()
 
             # Close WebSocket if still open
             if websocket.client_state != WebSocketState.DISCONNECTED:
                 try:
                     await websocket.close()
-                except Exception as e:  # pylint: disable=broad-except
-                    # Broad exception needed for WebSocket close errors
-                    logger.error("Error closing WebSocket for %s: %s", client_id, e)
+                except SOCKET_ERRORS as e:
+                    logger.warning("Error closing WebSocket for %s: %s", client_id, e)
 
-            # Remove from active connections
-            del self.active_connections[client_id]
+            connection_time = time.monotonic() - info.connected_at
+            logger.info(
+                "WebSocket disconnected: %s (Connected for %.1fs)",
+                client_id,
+                connection_time,
+            )
 
-            # Clean up metadata
-            if client_id in self.connection_metadata:
-                connection_time = (
-                    time.time() - self.connection_metadata[client_id]["connected_at"]
-                )
-                logger.info(
-                    "WebSocket disconnected: %s (Connected for %.1fs)",
-                    client_id,
-                    connection_time,
-                )
-                del self.connection_metadata[client_id]
+    async def _writer(self, client_id: str, websocket: WebSocket, queue):
+        """Drain one client's outbound queue onto its socket"""
 
-            # Stop heartbeat if no connections remain
-            if len(self.active_connections) == 0 and self.heartbeat_task:
-                self.heartbeat_task.cancel()
-                self.heartbeat_task = None
+        while True:
+            items = [await queue.get()]
+            while not queue.empty() and len(items) < COALESCE_MAX_ITEMS:
+                items.append(queue.get_nowait())
+            try:
+                # Payloads are already encoded, so they are joined without
+                # decoding; text and binary ones can both be queued around a
+                # hello, so each run of one kind is coalesced on its own
+                for binary, run in itertools.groupby(
+                    items, key=lambda item: isinstance(item, bytes)
+                ):
+                    frame = _coalesce(list(run))
+                    if binary:
+                        await websocket.send_bytes(frame)
+                    else:
+                        await websocket.send_text(frame)
+            except SOCKET_ERRORS as e:
+                logger.warning("Failed to send message to %s: %s", client_id, e)
+                await self.disconnect(client_id)
+                return
+            except Exception as e:  # pylint: disable=broad-except
+                # A bug, not a disconnect; nobody awaits this task, so dying
+                # here would leave the client registered with nothing draining
+                # its queue. Log it loudly and drop the connection instead
+                logger.error("Writer for %s failed: %r", client_id, e, exc_info=True)
+                await self.disconnect(client_id)
+                return
+
+    @staticmethod
+    def _enqueue(client_id: str, info: ConnInfo, payload: Union[str, bytes]) -> bool:
+        """Queue an encoded payload for a client; False if it has fallen behind"""
+
+        try:
+            info.queue.put_nowait(payload)
+            return True
+        except asyncio.QueueFull:
+            logger.warning("Outbound queue full, disconnecting %s", client_id)
+            return False
 
     async def send_personal_message(self, client_id: str, message: Dict[str, Any]):
-        """Send message to specific client with Sacred Geometry validation"""
+        """Send message to specific client with Sacred Geometry validation
+
+        Takes ownership of ``message``: the metadata is added to it in place
+        instead of copying it, so callers pass a fresh dict.
+        """
 
-        if client_id not in self.active_connections:
+        index = self._idx.get(client_id)
+        if index is None:
             logger.warning(
                 "Attempted to send message to non-existent client: %s", client_id
             )
             return False
-
-        websocket = self.active_connections[client_id]
-
-        try:
-            # Add Sacred Geometry metadata to message
-            enhanced_message = {
-                **message,
-                "phi_constant": PHI,
-                "client_id": client_id,
-                "server_timestamp": time.time(),
-            }
-
-            await websocket.send_json(enhanced_message)
-
-            # Update connection metadata
-            if client_id in self.connection_metadata:
-                metadata = self.connection_metadata[client_id]
-                metadata["message_count"] += 1
-                metadata["last_message_time"] = time.time()
-
-                # Update Sacred Geometry score based on message frequency
-                message_frequency = metadata["message_count"] / (
-                    time.time() - metadata["connected_at"] + 1
-                )
-                metadata["sacred_geometry_score"] = min(
-                    0.618 + (message_frequency * 0.1), PHI
-                )
-
-            return True
-
-        except Exception as e:  # pylint: disable=broad-except
-            # Broad exception needed for WebSocket message errors
-            logger.error("Failed to send message to %s: %s", client_id, e)
+        info = self._info[index]
+
+        # Add per-message metadata; phi_constant only goes out once, in the
+        # connection_established welcome
+        now = time.time()
+        message["client_id"] = client_id
+        message["server_timestamp"] = now
+
+        if info.binary:
+            payload = _packb(message)
+        else:
+            payload = orjson.dumps(message).decode("utf-8")
+        if not self._enqueue(client_id, info, payload):
             await self.disconnect(client_id)
             return False
 
+        # Update connection metadata
+        info.message_count += 1
+        info.last_message_time = now
+
+        return True
+
     async def broadcast(
         self, message: Dict[str, Any], exclude_client: Optional[str] = None
     ):
         """Broadcast message to all connected clients with φ-optimization"""
 
-        if not self.active_connections:
+        if not self._ids:
             return  # Add broadcast metadata
         broadcast_msg = {
             **message,
             "type": "broadcast",
-            "phi_constant": PHI,
             "server_timestamp": time.time(),
-            "connection_count": len(self.active_connections),
+            "connection_count": self.connection_count,
         }
 
-        # Send to all connections except excluded client
+        # Encode once for every recipient; text frames because the dashboards
+        # JSON.parse event.data
+        payload = orjson.dumps(broadcast_msg).decode("utf-8")
+
+        await self._fan_out(payload, lambda: _packb(broadcast_msg), exclude_client)
+
+    async def _fan_out(
+        self,
+        payload: str,
+        pack: Callable[[], bytes],
+        exclude_client: Optional[str] = None,
+    ):
+        """Queue one encoded payload for every client but exclude_client
+
+        ``payload`` is the JSON text; ``pack`` builds the msgpack encoding,
+        called at most once and only if a binary client is connected. The
+        loop stays plain Python: each pass is one non-blocking enqueue and
+        the sends happen in the writer tasks, so a compiled fan-out would
+        have no per-client coroutines to build.
+        """
+
+        # The writer tasks do the socket writes, so one slow client doesn't
+        # stall the rest. The live lists need no snapshot: _enqueue never
+        # awaits, so nothing can connect or disconnect mid-loop, and the
+        # awaited disconnects below run over the collected IDs
+        binary_payload = None
         disconnected_clients = []
-        for client_id, websocket in self.active_connections.items():
+        for client_id, info in zip(self._ids, self._info):
             if client_id == exclude_client:
                 continue
-
-            try:
-                await websocket.send_json(broadcast_msg)
-            except Exception as e:  # pylint: disable=broad-except
-                # Broad exception needed for WebSocket broadcast errors
-                logger.error("Failed to broadcast to %s: %s", client_id, e)
+            if info.binary:
+                if binary_payload is None:
+                    binary_payload = pack()
+                item = binary_payload
+            else:
+                item = payload
+            if not self._enqueue(client_id, info, item):
                 disconnected_clients.append(client_id)
 
-        # Clean up disconnected clients
-        for client_id in disconnected_clients:
-            await self.disconnect(client_id)
+        # Clean up disconnected clients, closing their sockets concurrently
+        if disconnected_clients:
+            await asyncio.gather(
+                *(self.disconnect(client_id) for client_id in disconnected_clients),
+                return_exceptions=True,
+            )
+
+    async def start(self):
+        """Start the heartbeat task, which lives as long as the application"""
+
+        if self.heartbeat_task is not None:
+            return  # Already started
+
+        # Fan-out is bound by socket writes, roughly 2-3x faster on uvloop
+        loop = asyncio.get_running_loop()
+        if sys.platform != "win32" and (
+            uvloop is None or not isinstance(loop, uvloop.Loop)
+        ):
+            logger.warning(
+                "WebSocket manager running on %s; use uvicorn --loop uvloop",
+                type(loop).__name__,
+            )
+
+        self.heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+
+    async def stop(self):
+        """Stop the heartbeat task"""
+
+        if self.heartbeat_task is not None:
+            self.heartbeat_task.cancel()
+            try:
+                await self.heartbeat_task
+            except asyncio.CancelledError:
+                pass
+            self.heartbeat_task = None
 
     async def _heartbeat_loop(self):
         """φ-Optimized heartbeat loop for connection health monitoring"""
 
-        while len(self.active_connections) > 0:
+        # Only the time and connection count change between heartbeats, so
+        # the constant part is serialized once and the frame is spliced
+        # (the prefix is the JSON object without its closing brace). The
+        # frame keeps the shape heartbeats had when they went through
+        # broadcast(): type "broadcast" plus its timestamp and count fields
+        prefix = orjson.dumps(
+            {"type": "broadcast", "phi_interval": self.heartbeat_interval}
+        ).decode("utf-8")[:-1]
+
+        while True:
             try:
                 await asyncio.sleep(self.heartbeat_interval)
+                if not self._ids:
+                    continue
 
                 # Send heartbeat to all connections
-                heartbeat_message = {
-                    "type": "heartbeat",
-                    "phi_interval": self.heartbeat_interval,
-                    "server_time": time.time(),
-                    "active_connections": len(self.active_connections),
-                }
-
-                await self.broadcast(heartbeat_message)
+                now, count = time.time(), self.connection_count
+                await self._fan_out(
+                    f'{prefix},"server_time":{now!r},"active_connections":{count},'
+                    f'"server_timestamp":{now!r},"connection_count":{count}}}',
+                    functools.partial(self._pack_heartbeat, now, count),
+                )
 
                 # Log heartbeat info
-                logger.debug(
-                    "Heartbeat sent to %d connections", len(self.active_connections)
-                )
+                logger.debug("Heartbeat sent to %d connections", self.connection_count)
 
             except asyncio.CancelledError:
                 logger.info("Heartbeat loop cancelled")
@@ -277,33 +487,40 @@ class WebSocketManager:
                 # Broad exception needed for heartbeat loop errors
                 logger.error("Error in heartbeat loop: %s", e)
 
-    def get_connection_stats(self) -> Dict[str, Any]:
-        """Get comprehensive connection statistics with Sacred Geometry metrics"""
+    def _pack_heartbeat(self, server_time: float, count: int) -> bytes:
+        """msgpack form of a heartbeat, for binary clients"""
 
-        total_connections = len(self.active_connections)
-        total_messages = sum(
-            metadata.get("message_count", 0)
-            for metadata in self.connection_metadata.values()
+        return _packb(
+            {
+                "type": "broadcast",
+                "phi_interval": self.heartbeat_interval,
+                "server_time": server_time,
+                "active_connections": count,
+                "server_timestamp": server_time,
+                "connection_count": count,
+            }
         )
 
-        avg_connection_time = 0
-        avg_sacred_geometry_score = 0
-
-        if total_connections > 0:
-            current_time = time.time()
-            connection_times = [
-                current_time - metadata["connected_at"]
-                for metadata in self.connection_metadata.values()
-            ]
-            avg_connection_time = sum(connection_times) / len(connection_times)
-
-            sacred_geometry_scores = [
-                metadata.get("sacred_geometry_score", 0)
-                for metadata in self.connection_metadata.values()
-            ]
-            avg_sacred_geometry_score = sum(sacred_geometry_scores) / len(
-                sacred_geometry_scores
-            )
+    def get_connection_stats(self) -> Dict[str, Any]:
+        """Get comprehensive connection statistics with Sacred Geometry metrics"""
+
+        # One pass over the connection records
+        current_time = time.monotonic()
+        count = total_messages = 0
+        total_connection_time = total_sacred_geometry_score = 0.0
+        for info in self._info:
+            count += 1
+            total_messages += info.message_count
+            connection_time = current_time - info.connected_at
+            total_connection_time += connection_time
+            # Sacred Geometry score from message frequency, derived here rather
+            # than on every send
+            message_frequency = info.message_count / (connection_time + 1)
+            total_sacred_geometry_score += min(0.618 + message_frequency * 0.1, PHI)
+
+        total_connections = self.connection_count
+        avg_connection_time = total_connection_time / count if count else 0
+        avg_sacred_geometry_score = total_sacred_geometry_score / count if count else 0
 
         return {
             "active_connections": total_connections,
@@ -324,6 +541,18 @@ class WebSocketManager:
 ws_manager = WebSocketManager()
 
 
+@websocket_router.on_event("startup")
+async def start_websocket_manager():
+    """Start the shared heartbeat with the application"""
+    await ws_manager.start()
+
+
+@websocket_router.on_event("shutdown")
+async def stop_websocket_manager():
+    """Stop the shared heartbeat with the application"""
+    await ws_manager.stop()
+
+
 @websocket_router.websocket("/ws")
 async def websocket_endpoint(
     websocket: WebSocket,
@@ -342,7 +571,7 @@ async def websocket_endpoint(
 
     # Generate client ID if not provided
     if not client_id:
-        client_id = f"client_{int(time.time())}_{id(websocket)}"
+        client_id = ws_manager.new_client_id()
 
     # FUTURE: Add token validation in production
     # For now, accept all connections
@@ -362,12 +591,13 @@ async def websocket_endpoint(
 
             if message_type == "ping":
                 # Respond to ping with pong
+                now = time.time()
                 await ws_manager.send_personal_message(
                     client_id,
                     {
                         "type": "pong",
-                        "original_timestamp": data.get("timestamp", time.time()),
-                        "response_timestamp": time.time(),
+                        "original_timestamp": data.get("timestamp", now),
+                        "response_timestamp": now,
                     },
                 )
 
@@ -383,6 +613,13 @@ async def websocket_endpoint(
                     },
                 )
 
+            elif message_type == "hello":
+                # Opt in to msgpack binary frames (server to client only)
+                binary = ws_manager.set_binary(client_id, bool(data.get("binary")))
+                await ws_manager.send_personal_message(
+                    client_id, {"type": "hello_ack", "binary": binary}
+                )
+
             elif message_type == "subscribe":
                 # Subscribe to specific updates
                 subscription_type = data.get("subscription", "all")
@@ -426,20 +663,21 @@ async def broadcast_message(message: Dict[str, Any]):
     """Broadcast message to all connected WebSocket clients (admin only)"""
     # FUTURE: Add authentication check in production
 
+    now = time.time()
     try:
         await ws_manager.broadcast(
             {
                 "type": "admin_broadcast",
                 "content": message,
-                "broadcast_time": time.time(),
+                "broadcast_time": now,
             }
         )
 
         return {
             "success": True,
             "message": "Broadcast sent successfully",
-            "recipients": len(ws_manager.active_connections),
-            "timestamp": time.time(),
+            "recipients": ws_manager.connection_count,
+            "timestamp": now,
         }
 
     except Exception as e:  # pylint: disable=broad-except